@@ -5,9 +5,13 @@ This module provides a simplified interface for common operations with Loupedeck
 It builds on top of the lower-level device API to provide a more user-friendly experience.
 """
 
+from __future__ import annotations
+
 import os
-from typing import Callable, Dict, List, Optional, Tuple, Union
-from PIL import Image, ImageDraw, ImageFont
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 from .device import LoupedeckDevice
 from .constants import BUTTONS
@@ -153,6 +157,8 @@ class LoupedeckAPI:
         width = screen_info["width"]
         height = screen_info["height"]
 
+        from PIL import Image, ImageDraw, ImageFont
+
         # Create a new image with the background color
         image = Image.new("RGB", (width, height), background_color)
         draw = ImageDraw.Draw(image)
@@ -236,6 +242,8 @@ class LoupedeckAPI:
         button_width = width // cols
         button_height = height // rows
 
+        from PIL import Image, ImageDraw, ImageFont
+
         # Create a new image with the background color
         image = Image.new("RGB", (width, height), background_color)
         draw = ImageDraw.Draw(image)
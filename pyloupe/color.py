@@ -1,6 +1,19 @@
+from functools import lru_cache
 from typing import Tuple, Union, List
 
 
+@lru_cache(maxsize=128)
+def _parse_hex(color: str) -> Tuple[int, int, int, int]:
+    """Parse a hex color string; cached since callers reuse a small palette."""
+    c = color.lstrip("#")
+    if len(c) == 3:
+        c = "".join(ch * 2 for ch in c)
+    r = int(c[0:2], 16)
+    g = int(c[2:4], 16)
+    b = int(c[4:6], 16)
+    return r, g, b, 255
+
+
 def parse_color(
     color: Union[str, Tuple[int, int, int], List[int]],
 ) -> Tuple[int, int, int, int]:
@@ -18,13 +31,7 @@ def parse_color(
         ValueError: If the color format is not supported.
     """
     if isinstance(color, str):
-        c = color.lstrip("#")
-        if len(c) == 3:
-            c = "".join(ch * 2 for ch in c)
-        r = int(c[0:2], 16)
-        g = int(c[2:4], 16)
-        b = int(c[4:6], 16)
-        return r, g, b, 255
+        return _parse_hex(color)
     elif isinstance(color, (tuple, list)):
         r, g, b = color[:3]
         return int(r), int(g), int(b), 255
@@ -1,5 +1,6 @@
 """Serial connection handling for Loupedeck devices."""
 
+import logging
 import serial
 from serial.tools import list_ports
 from ..parser import MagicByteLengthParser
@@ -183,7 +184,8 @@ class LoupedeckSerialConnection(Connection):
     def is_ready(self):
         """Return ``True`` if the underlying serial port is open."""
         is_ready = self.connection is not None and self.connection.is_open
-        self.logger.debug("Connection ready: %s", is_ready)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Connection ready: %s", is_ready)
         return is_ready
 
     def read(self):
@@ -192,23 +194,26 @@ class LoupedeckSerialConnection(Connection):
             self.logger.warning("Cannot read: connection not ready")
             return
 
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         try:
             bytes_waiting = self.connection.in_waiting or 1
-            self.logger.debug("Reading %d bytes from serial port", bytes_waiting)
+            if debug:
+                self.logger.debug("Reading %d bytes from serial port", bytes_waiting)
 
             # Set a timeout for the read operation
             self.connection.timeout = self.timeout
             data = self.connection.read(bytes_waiting)
 
             if data:
-                self.logger.debug("Read %d bytes", len(data))
-                packets = self.parser.feed(data)
-                self.logger.debug("Parsed %d packets", len(packets))
+                if debug:
+                    self.logger.debug("Read %d bytes", len(data))
 
-                for pkt in packets:
-                    self.logger.debug("Emitting message (%d bytes)", len(pkt))
+                # Emit each packet as soon as it is parsed
+                for pkt in self.parser.feed_iter(data):
+                    if debug:
+                        self.logger.debug("Emitting message (%d bytes)", len(pkt))
                     self.emit("message", pkt)
-            else:
+            elif debug:
                 self.logger.debug("No data read (possible timeout)")
         except serial.SerialTimeoutException as e:
             self.logger.warning("Timeout reading from serial port: %s", str(e))
@@ -229,6 +234,7 @@ class LoupedeckSerialConnection(Connection):
 
         retry_count = 0
         max_send_retries = 2 if retry_on_error else 0
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         while retry_count <= max_send_retries:
             try:
@@ -236,25 +242,26 @@ class LoupedeckSerialConnection(Connection):
                 self.connection.write_timeout = self.timeout
 
                 if not raw:
-                    self.logger.debug("Preparing data frame for %d bytes", len(buff))
                     if len(buff) > 0xFF:
-                        self.logger.debug("Using extended frame format")
                         prep = bytearray(14)
                         prep[0] = 0x82
                         prep[1] = 0xFF
                         prep[6:10] = len(buff).to_bytes(4, "big")
                     else:
-                        self.logger.debug("Using standard frame format")
                         prep = bytearray(6)
                         prep[0] = 0x82
                         prep[1] = 0x80 + len(buff)
 
-                    self.logger.debug("Writing %d bytes header", len(prep))
+                    if debug:
+                        self.logger.debug("Writing %d bytes header (%s frame format)", len(prep),
+                                          "extended" if len(buff) > 0xFF else "standard")
                     self.connection.write(prep)
 
-                self.logger.debug("Writing %d bytes payload", len(buff))
+                if debug:
+                    self.logger.debug("Writing %d bytes payload", len(buff))
                 self.connection.write(buff)
-                self.logger.debug("Data sent successfully")
+                if debug:
+                    self.logger.debug("Data sent successfully")
                 return  # Success, exit the retry loop
             except serial.SerialTimeoutException as e:
                 self.logger.warning("Timeout sending data: %s", str(e))
@@ -1,6 +1,7 @@
 """WebSocket connection handling for Loupedeck devices."""
 
 import asyncio
+import logging
 import socket
 import ipaddress
 import websockets
@@ -291,7 +292,8 @@ class LoupedeckWSConnection(Connection):
     def is_ready(self):
         """Return ``True`` if the WebSocket is open."""
         is_ready = self.connection and not self.connection.closed
-        self.logger.debug("Connection ready: %s", is_ready)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Connection ready: %s", is_ready)
         return is_ready
 
     async def _check_connected(self):
@@ -312,10 +314,12 @@ class LoupedeckWSConnection(Connection):
     async def read(self):
         """Read messages from the WebSocket and emit events."""
         self.logger.debug("Starting to read messages")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         try:
             async for message in self.connection:
                 self.last_tick = asyncio.get_event_loop().time()
-                self.logger.debug("Received message (%d bytes)", len(message))
+                if debug:
+                    self.logger.debug("Received message (%d bytes)", len(message))
                 self.emit("message", message)
         except Exception as e:
             self.logger.error("Error reading from connection: %s", str(e))
@@ -329,10 +333,13 @@ class LoupedeckWSConnection(Connection):
             self.logger.warning("Cannot send data: connection not ready")
             return
 
-        self.logger.debug("Sending data (%d bytes)", len(data))
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Sending data (%d bytes)", len(data))
         try:
             await self.connection.send(data)
-            self.logger.debug("Data sent successfully")
+            if debug:
+                self.logger.debug("Data sent successfully")
         except Exception as e:
             self.logger.error("Error sending data: %s", str(e))
             raise
@@ -45,6 +45,18 @@ BUTTONS = {
     0x29: 14,
 }
 
+# Logical button ID -> hardware code. Several codes share a logical ID
+# (the Live and Live S number their keys from 0), so the first code listed
+# in BUTTONS wins.
+BUTTONS_REVERSE = {}
+for _code, _name in BUTTONS.items():
+    BUTTONS_REVERSE.setdefault(_name, _code)
+del _code, _name
+
+# Hardware code -> logical button ID, indexable by any byte value so event
+# handlers can skip both the dict lookup and a bounds check.
+BUTTON_BY_CODE = tuple(BUTTONS.get(code) for code in range(256))
+
 CONNECTION_TIMEOUT = 3000
 
 COMMANDS = {
@@ -68,6 +80,11 @@ COMMANDS = {
 
 DEFAULT_RECONNECT_INTERVAL = 3000
 
+# Reconnect backoff: the first retry waits this many milliseconds and each
+# further retry doubles it, capped at the device's reconnect_interval.
+RECONNECT_BASE_DELAY = 200
+RECONNECT_MAX_RETRIES = 10
+
 HAPTIC = {
     "SHORT": 0x01,
     "MEDIUM": 0x0A,
@@ -3,23 +3,31 @@
 from __future__ import annotations
 import struct
 import asyncio
+import importlib
+import logging
+import random
 import time
-from typing import Union, Literal, Optional
-from PIL import Image
+from typing import TYPE_CHECKING, Union, Literal, Optional, Tuple
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 from .constants import (
     BUTTONS,
+    BUTTON_BY_CODE,
+    BUTTONS_REVERSE,
     COMMANDS,
     DEFAULT_RECONNECT_INTERVAL,
     DEFAULT_COMMAND_INTERVAL,
     HAPTIC,
     MAX_BRIGHTNESS,
+    RECONNECT_BASE_DELAY,
+    RECONNECT_MAX_RETRIES,
 )
+from .color import parse_color
 from .eventemitter import EventEmitter
-from .util import rgba2rgb565
+from .util import image2rgb565
 from .parser import MagicByteLengthParser
-from .connections.serial import LoupedeckSerialConnection
-from .connections.ws import LoupedeckWSConnection
 from .logger import get_logger
 from .exceptions import (
     DeviceNotFoundError,
@@ -29,6 +37,60 @@ from .exceptions import (
     UnsupportedFeatureError,
 )
 
+# Length, command and transaction ID prefixing every packet in both directions
+_HEADER = struct.Struct("BBB")
+_PACK_B = struct.Struct("B").pack
+_PACK_BBBB = struct.Struct("BBBB").pack
+# Framebuffer region header: 2-byte screen ID, then x, y, width, height
+_FB_HEADER = struct.Struct("<2sHHHH")
+
+# Bound on distinct framebuffer regions whose headers are kept
+_MAX_CACHED_HEADERS = 64
+
+# Transport classes and the modules defining them. Each pulls in its own
+# third-party stack (pyserial, websockets), so they are imported on first
+# use rather than with the package.
+_TRANSPORTS = {
+    "LoupedeckSerialConnection": ".connections.serial",
+    "LoupedeckWSConnection": ".connections.ws",
+}
+
+
+def _transport(name: str):
+    """Return a transport class, importing its module on first use.
+
+    Module globals are checked first so the classes can still be patched
+    as ``pyloupe.device.LoupedeckWSConnection`` and friends.
+    """
+    cls = globals().get(name)
+    if cls is None:
+        module = importlib.import_module(_TRANSPORTS[name], __package__)
+        cls = globals()[name] = getattr(module, name)
+    return cls
+
+
+def __getattr__(name: str):
+    if name in _TRANSPORTS:
+        return _transport(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _display_table(displays: dict) -> dict:
+    """Flatten ``displays`` into ``(id, width, height, endianness)`` tuples."""
+    return {
+        name: (info["id"], info["width"], info["height"], info.get("endianness", "le"))
+        for name, info in displays.items()
+    }
+
+
+def _loop_running() -> bool:
+    """Return ``True`` if called from inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
 
 class LoupedeckDevice(EventEmitter):
     key_size = 90
@@ -42,11 +104,11 @@ class LoupedeckDevice(EventEmitter):
                                     not ignore_serial, not ignore_websocket)
         devices = []
         if not ignore_serial:
-            serial_devices = LoupedeckSerialConnection.discover()
+            serial_devices = _transport("LoupedeckSerialConnection").discover()
             LoupedeckDevice.logger.debug("Found %d serial devices", len(serial_devices))
             devices.extend(serial_devices)
         if not ignore_websocket:
-            ws_devices = LoupedeckWSConnection.discover()
+            ws_devices = _transport("LoupedeckWSConnection").discover()
             LoupedeckDevice.logger.debug("Found %d WebSocket devices", len(ws_devices))
             devices.extend(ws_devices)
         LoupedeckDevice.logger.info("Found %d total devices", len(devices))
@@ -76,8 +138,9 @@ class LoupedeckDevice(EventEmitter):
             path: Optional serial path for a USB connection.
             auto_connect: If ``True`` the device will attempt to connect
                 immediately.
-            reconnect_interval: Interval in milliseconds between reconnection
-                attempts. ``None`` disables automatic reconnect.
+            reconnect_interval: Maximum delay in milliseconds between
+                reconnection attempts, which back off exponentially up to
+                this value. ``None`` disables automatic reconnect.
             command_interval: Minimum delay in milliseconds between commands to
                 avoid overloading the device.
         """
@@ -99,10 +162,20 @@ class LoupedeckDevice(EventEmitter):
         self.connection = None
         self.pending_transactions: dict[int, callable] = {}
         self._reconnect_task = None
+        self._reconnect_attempt = 0
+        self._write_queue = None
+        self._write_task = None
+        self._send_buffer = bytearray()
+        self._async_checked = None
+        self._send_is_async = False
         self._should_reconnect = reconnect_interval is not None
         self.command_interval = command_interval / 1000.0
         self._last_command_time = 0.0
 
+        # Reusable frame buffer payloads, one per screen
+        self._fb_buffers: dict[str, bytearray] = {}
+        self._fb_headers: dict[tuple, bytes] = {}
+
         # Custom button mapping dictionary
         self.button_mapping = {}
 
@@ -132,19 +205,36 @@ class LoupedeckDevice(EventEmitter):
             self.logger.info("Scheduling reconnection attempt")
             self._schedule_reconnect()
 
+    def _reconnect_delay(self, attempt: int) -> float:
+        """Return the backoff delay in milliseconds for a reconnect attempt.
+
+        Up to 10% jitter is taken off the delay rather than added, so it
+        never exceeds ``reconnect_interval``.
+        """
+        delay = min(self.reconnect_interval, RECONNECT_BASE_DELAY * 2 ** attempt)
+        return delay - random.uniform(0, 0.1 * delay)
+
     def _schedule_reconnect(self):
         """Schedule a reconnection attempt."""
         if self._reconnect_task is not None:
             self.logger.debug("Reconnection already scheduled, skipping")
             return
 
+        if self._reconnect_attempt >= RECONNECT_MAX_RETRIES:
+            self.logger.error("Giving up after %d reconnection attempts", self._reconnect_attempt)
+            self.emit("reconnect_failed", {"attempts": self._reconnect_attempt})
+            return
+
+        delay = self._reconnect_delay(self._reconnect_attempt)
+        self._reconnect_attempt += 1
+
         async def reconnect_task():
-            self.logger.debug("Waiting %d ms before reconnection attempt", self.reconnect_interval)
-            await asyncio.sleep(self.reconnect_interval / 1000)
+            self.logger.debug("Waiting %d ms before reconnection attempt", delay)
+            await asyncio.sleep(delay / 1000)
             self._reconnect_task = None
             try:
                 self.logger.info("Attempting to reconnect")
-                self.connect()
+                await self._reconnect()
                 self.logger.info("Reconnection successful")
                 self.emit("reconnect", None)
             except Exception as e:
@@ -152,7 +242,7 @@ class LoupedeckDevice(EventEmitter):
                 self.emit("reconnect_error", {"error": str(e)})
                 self._schedule_reconnect()
 
-        self.logger.info("Scheduling reconnection attempt")
+        self.logger.info("Scheduling reconnection attempt %d", self._reconnect_attempt)
         self.emit("reconnect_attempt", None)
         loop = asyncio.get_event_loop()
         self._reconnect_task = loop.create_task(reconnect_task())
@@ -160,13 +250,42 @@ class LoupedeckDevice(EventEmitter):
     def connect(self):
         """Establish a connection to the first available device."""
         self.logger.info("Connecting to device")
+        self._create_connection()
+
+        if hasattr(self.connection, "connect"):
+            self.logger.debug("Establishing connection")
+            if asyncio.iscoroutinefunction(self.connection.connect):
+                self.logger.debug("Using asyncio for connection")
+                asyncio.get_event_loop().run_until_complete(self.connection.connect())
+            else:
+                self.connection.connect()
+
+        self._attach_handlers()
+        self.logger.info("Connection established")
+        return self
+
+    async def _reconnect(self):
+        """Connect again from inside the running event loop.
+
+        ``connect`` cannot drive an async transport while the loop is
+        already running, so reconnect tasks await it here instead.
+        """
+        self._create_connection()
+        if hasattr(self.connection, "connect"):
+            if asyncio.iscoroutinefunction(self.connection.connect):
+                await self.connection.connect()
+            else:
+                self.connection.connect()
+        self._attach_handlers()
 
+    def _create_connection(self):
+        """Create the transport for the configured or first discovered device."""
         if self.path:
             self.logger.debug("Using serial connection with path: %s", self.path)
-            self.connection = LoupedeckSerialConnection(self.path)
+            self.connection = _transport("LoupedeckSerialConnection")(self.path)
         elif self.host:
             self.logger.debug("Using WebSocket connection with host: %s", self.host)
-            self.connection = LoupedeckWSConnection(self.host)
+            self.connection = _transport("LoupedeckWSConnection")(self.host)
         else:
             self.logger.debug("No path or host specified, discovering devices")
             devices = self.list()
@@ -179,13 +298,11 @@ class LoupedeckDevice(EventEmitter):
             self.logger.info("Using discovered device: %s", args)
             self.connection = conn_type(**args)
 
-        if hasattr(self.connection, "connect"):
-            self.logger.debug("Establishing connection")
-            if asyncio.iscoroutinefunction(self.connection.connect):
-                self.logger.debug("Using asyncio for connection")
-                asyncio.get_event_loop().run_until_complete(self.connection.connect())
-            else:
-                self.connection.connect()
+    def _attach_handlers(self):
+        """Listen for connection events on the current transport."""
+        # Any successful connection, manual or automatic, earns a fresh
+        # set of reconnect attempts
+        self._reconnect_attempt = 0
 
         # Store event handler references for later cleanup
         self._connect_handler = lambda data: self.emit("connect", data)
@@ -198,9 +315,6 @@ class LoupedeckDevice(EventEmitter):
         self.connection.on("message", self._message_handler)
         self.connection.on("disconnect", self._disconnect_handler)
 
-        self.logger.info("Connection established")
-        return self
-
     def close(self):
         """Close the device connection and cleanup resources."""
         self.logger.info("Closing device connection")
@@ -211,6 +325,14 @@ class LoupedeckDevice(EventEmitter):
             self._reconnect_task.cancel()
             self._reconnect_task = None
 
+        # Stop the background writer used for sends from a running loop
+        if self._write_task is not None:
+            self._flush_writes()
+            self.logger.debug("Cancelling background writer task")
+            self._write_task.cancel()
+            self._write_task = None
+            self._write_queue = None
+
         # Disable automatic reconnection
         self._should_reconnect = False
         self.logger.debug("Disabled automatic reconnection")
@@ -236,6 +358,7 @@ class LoupedeckDevice(EventEmitter):
 
             # Clear connection reference
             self.connection = None
+            self._async_checked = None
             self.logger.info("Connection closed and reference cleared")
 
     # Simplified drawing and command helpers
@@ -256,36 +379,140 @@ class LoupedeckDevice(EventEmitter):
             self.logger.warning("Cannot send command: connection not ready")
             raise CommandError("Cannot send command: device connection is not ready")
 
-        now = time.monotonic()
-        elapsed = now - self._last_command_time
-        if elapsed < self.command_interval:
-            sleep_time = self.command_interval - elapsed
-            self.logger.debug("Rate limiting active; sleeping %.3f seconds", sleep_time)
-            time.sleep(sleep_time)
+        # Checked once per call; logging clears this cache on setLevel()
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        self.transaction_id = (self.transaction_id + 1) % 256 or 1
-        header = struct.pack(
-            "BBB", min(3 + len(data), 0xFF), command, self.transaction_id
-        )
-        packet = header + data
+        is_async = self._connection_is_async()
+        queued = is_async and _loop_running()
 
-        self.logger.debug("Sending command: %d, transaction ID: %d, data length: %d", 
-                         command, self.transaction_id, len(data))
+        # Queued packets are spaced out by the writer task instead, since
+        # sleeping here would stall the running loop
+        if not queued:
+            sleep_time = self._command_delay()
+            if sleep_time > 0:
+                if debug:
+                    self.logger.debug("Rate limiting active; sleeping %.3f seconds", sleep_time)
+                time.sleep(sleep_time)
 
-        if hasattr(self.connection, "send"):
-            if asyncio.iscoroutinefunction(self.connection.send):
+        if queued:
+            # Queued packets outlive this call and need their own copy
+            packet = self._build_packet(command, data)
+        else:
+            packet = self._pack_send_buffer(command, data)
+
+        if debug:
+            self.logger.debug("Sending command: %d, transaction ID: %d, data length: %d",
+                              command, self.transaction_id, len(data))
+
+        if queued:
+            # Called from inside the loop, which cannot be re-entered
+            if debug:
+                self.logger.debug("Queueing data for the background writer")
+            self._enqueue_packet(packet)
+        elif is_async:
+            if debug:
                 self.logger.debug("Using asyncio for sending data")
-                asyncio.get_event_loop().run_until_complete(
-                    self.connection.send(packet)
-                )
-            else:
-                self.connection.send(packet)
+            asyncio.get_event_loop().run_until_complete(self.connection.send(packet))
+        else:
+            self.connection.send(packet)
+
+        if not queued:
+            self._last_command_time = time.monotonic()
 
-        self._last_command_time = time.monotonic()
+        if debug:
+            self.logger.debug("Command sent successfully")
+        return self.transaction_id
+
+    def _command_delay(self) -> float:
+        """Return how many seconds to wait before the next command may go out."""
+        return self._last_command_time + self.command_interval - time.monotonic()
+
+    def _connection_is_async(self) -> bool:
+        """Return ``True`` if the current connection sends with coroutines.
+
+        The answer is cached per connection object, since ``send`` asks on
+        every packet and ``iscoroutinefunction`` is not free.
+        """
+        connection = self.connection
+        if connection is not self._async_checked:
+            self._send_is_async = asyncio.iscoroutinefunction(connection.send)
+            self._async_checked = connection
+        return self._send_is_async
+
+    def _enqueue_packet(self, packet: bytes):
+        """Hand a packet to the writer task, starting it on first use."""
+        if self._write_task is None or self._write_task.done():
+            self._write_queue = asyncio.Queue()
+            self._write_task = asyncio.ensure_future(self._writer(self._write_queue))
+        self._write_queue.put_nowait(packet)
+
+    async def _writer(self, queue: asyncio.Queue):
+        """Send queued packets one at a time, in order.
+
+        Packets are never joined: over WebSocket each message must carry
+        exactly one packet. Each send waits out ``command_interval`` without
+        blocking the loop.
+        """
+        while True:
+            packet = await queue.get()
+            try:
+                if self.connection is None:
+                    continue
+                delay = self._command_delay()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    await self.connection.send(packet)
+                except Exception as e:
+                    self.logger.error("Background send failed: %s", str(e))
+                self._last_command_time = time.monotonic()
+            finally:
+                queue.task_done()
+
+    def _flush_writes(self):
+        """Send packets still waiting for the writer task, if possible.
+
+        When the writer's loop is idle it is run until the queue is empty.
+        From inside the running loop ``close`` cannot wait, so the packets
+        left in the queue are dropped and counted in the log.
+        """
+        queue = self._write_queue
+        pending = queue.qsize()
+        if not pending or self._write_task.done():
+            return
+        loop = self._write_task.get_loop()
+        if loop.is_running() or loop.is_closed():
+            self.logger.warning("Dropping %d queued packet(s) on close", pending)
+            return
+        self.logger.debug("Flushing %d queued packet(s) before closing", pending)
+        loop.run_until_complete(queue.join())
 
-        self.logger.debug("Command sent successfully")
+    def _next_transaction_id(self) -> int:
+        """Advance the transaction ID, wrapping from 255 back to 1."""
+        tid = (self.transaction_id + 1) & 0xFF
+        self.transaction_id = tid if tid else 1
         return self.transaction_id
 
+    def _build_packet(self, command: int, data: bytes = b"") -> bytes:
+        """Assign the next transaction ID and prepend the command header."""
+        tid = self._next_transaction_id()
+        header = _HEADER.pack(min(3 + len(data), 0xFF), command, tid)
+        return header + data
+
+    def _pack_send_buffer(self, command: int, data: bytes = b"") -> memoryview:
+        """Like :meth:`_build_packet`, but written into a reusable buffer.
+
+        The returned view is overwritten by the next call, so it may only be
+        used for a send that completes before :meth:`send` returns.
+        """
+        size = 3 + len(data)
+        if len(self._send_buffer) < size:
+            self._send_buffer = bytearray(size)
+        tid = self._next_transaction_id()
+        _HEADER.pack_into(self._send_buffer, 0, min(size, 0xFF), command, tid)
+        self._send_buffer[3:size] = data
+        return memoryview(self._send_buffer)[:size]
+
     def set_brightness(self, value: float):
         """Set the device screen brightness.
 
@@ -293,7 +520,7 @@ class LoupedeckDevice(EventEmitter):
             value: Brightness value from 0.0 to 1.0.
         """
         byte = max(0, min(MAX_BRIGHTNESS, round(value * MAX_BRIGHTNESS)))
-        self.send(COMMANDS["SET_BRIGHTNESS"], bytes([byte]))
+        self.send(COMMANDS["SET_BRIGHTNESS"], _PACK_B(byte))
 
     def set_button_mapping(self, hw_button_id: int, custom_id: str | int):
         """Set a custom mapping for a button.
@@ -329,24 +556,51 @@ class LoupedeckDevice(EventEmitter):
         elif hw_button_id in self.button_mapping:
             del self.button_mapping[hw_button_id]
 
-    def set_button_color(self, id: str, color: str):
+    def set_button_color(self, id: str, color: Union[str, Tuple[int, int, int]]):
         """Change the color of a button LED.
 
         Args:
             id: Logical button identifier.
-            color: Color string in hex format (``"#RRGGBB"``).
+            color: Color string in hex format (``"#RRGGBB"``) or an
+                ``(r, g, b)`` tuple.
         """
-        key = next((k for k, v in BUTTONS.items() if v == id), None)
+        key = BUTTONS_REVERSE.get(id)
         if key is None:
             self.logger.error("Invalid button ID: %s", id)
             raise ValidationError(f"Invalid button ID: {id}")
-        from .color import parse_color
-
         r, g, b, _ = parse_color(color)
-        self.send(COMMANDS["SET_COLOR"], bytes([key, r, g, b]))
+        self.send(COMMANDS["SET_COLOR"], _PACK_BBBB(key, r, g, b))
+
+    def _get_display_cache(self) -> dict:
+        """Return ``(id, width, height, endianness)`` tuples keyed by screen.
+
+        The table is built from :attr:`displays` on first use and stored on
+        the class itself, so subclasses that override ``displays`` get their
+        own copy. A ``displays`` dict assigned to an instance takes precedence
+        and gets a table of its own, rebuilt whenever it is reassigned.
+        """
+        displays = self.__dict__.get("displays")
+        if displays is not None:
+            cached = self.__dict__.get("_instance_display_cache")
+            if cached is None or cached[0] is not displays:
+                cached = (displays, _display_table(displays))
+                self._instance_display_cache = cached
+            return cached[1]
+
+        cls = type(self)
+        cache = cls.__dict__.get("_display_cache")
+        if cache is None:
+            cache = _display_table(getattr(cls, "displays", {}))
+            cls._display_cache = cache
+        return cache
 
     def display_image(
-        self, image: Image.Image, screen: str = "center", x: int = 0, y: int = 0
+        self,
+        image: Image.Image,
+        screen: str = "center",
+        x: int = 0,
+        y: int = 0,
+        strict: bool = False,
     ):
         """Display an image on the device screen.
 
@@ -355,74 +609,263 @@ class LoupedeckDevice(EventEmitter):
             screen (str): The target screen ('center', 'left', 'right', 'knob')
             x (int): The x-coordinate offset
             y (int): The y-coordinate offset
+            strict (bool): If ``True``, reject images that don't match the
+                screen dimensions instead of resizing them
 
         Raises:
             ValidationError: If the screen is invalid or the image is incompatible
         """
-        if not hasattr(self, "displays") or screen not in self.displays:
+        display = self._get_display_cache().get(screen)
+        if display is None:
             self.logger.error("Invalid screen: %s", screen)
             raise ValidationError(f"Invalid screen: {screen}")
 
-        # Get screen dimensions
-        screen_info = self.displays[screen]
-        screen_width = screen_info["width"]
-        screen_height = screen_info["height"]
+        screen_id, screen_width, screen_height, endianness = display
+
+        needs_resize = image.size != (screen_width, screen_height)
+        if needs_resize and strict:
+            self.logger.error(
+                "Image size %dx%d does not match %s screen (%dx%d)",
+                image.width,
+                image.height,
+                screen,
+                screen_width,
+                screen_height,
+            )
+            raise ValidationError(
+                f"Image size {image.width}x{image.height} does not match "
+                f"{screen} screen ({screen_width}x{screen_height})"
+            )
+
+        if needs_resize:
+            from PIL import Image
+
+            # Bilinear is the filter Pillow-SIMD accelerates; Image.Resampling is 9.1+
+            resample = getattr(Image, "Resampling", Image).BILINEAR
+
+        # Grayscale converts to RGB by copying the band, so a shrinking
+        # resize is cheaper on the single band than on three
+        if (
+            needs_resize
+            and image.mode == "L"
+            and image.width * image.height > screen_width * screen_height
+        ):
+            image = image.resize((screen_width, screen_height), resample)
+            needs_resize = False
 
         # Ensure image is in RGB mode
         if image.mode != "RGB":
             image = image.convert("RGB")
 
         # Resize image if it doesn't match the screen dimensions
-        if image.width != screen_width or image.height != screen_height:
-            image = image.resize((screen_width, screen_height))
+        if needs_resize:
+            image = image.resize((screen_width, screen_height), resample)
+
+        # Pack pixels to RGB565, high byte first on big-endian screens
+        rgb565_data = image2rgb565(image, big_endian=endianness == "be")
+
+        return self._send_framebuffer(
+            screen, screen_id, x, y, image.width, image.height, rgb565_data
+        )
+
+    def display_buffer(
+        self,
+        data: bytes,
+        screen: str = "center",
+        x: int = 0,
+        y: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ):
+        """Display prepacked RGB565 pixels on the device screen.
 
-        # Convert image to RGBA bytes
-        rgba_data = bytearray()
-        pixels = image.load()
-        for y_pos in range(image.height):
-            for x_pos in range(image.width):
-                r, g, b = pixels[x_pos, y_pos]
-                rgba_data.extend([r, g, b, 255])  # Add alpha channel
+        This skips the image conversion done by :meth:`display_image`, so
+        callers that draw the same pixels repeatedly can pack them once. The
+        data must already be in the screen's byte order (see the
+        ``endianness`` entry of :attr:`displays`).
 
-        # Convert RGBA to RGB565
-        rgb565_data = rgba2rgb565(rgba_data, image.width * image.height)
+        Args:
+            data: RGB565 pixels, two bytes per pixel, row by row
+            screen (str): The target screen ('center', 'left', 'right', 'knob')
+            x (int): The x-coordinate offset
+            y (int): The y-coordinate offset
+            width (int): Width of the region; defaults to the screen width
+            height (int): Height of the region; defaults to the screen height
 
-        # Prepare the frame buffer command
-        screen_id = screen_info["id"]
+        Raises:
+            ValidationError: If the screen is invalid or the data size does
+                not match the region
+        """
+        display = self._get_display_cache().get(screen)
+        if display is None:
+            self.logger.error("Invalid screen: %s", screen)
+            raise ValidationError(f"Invalid screen: {screen}")
 
-        # Create header with screen ID, x, y, width, height
-        header = bytearray()
-        header.extend(screen_id)
-        header.extend(struct.pack("<HH", x, y))
-        header.extend(struct.pack("<HH", image.width, image.height))
+        screen_id, screen_width, screen_height, _ = display
+        if width is None:
+            width = screen_width
+        if height is None:
+            height = screen_height
+
+        if len(data) != width * height * 2:
+            self.logger.error(
+                "Buffer of %d bytes does not match a %dx%d region",
+                len(data),
+                width,
+                height,
+            )
+            raise ValidationError(
+                f"Buffer of {len(data)} bytes does not match a {width}x{height} region"
+            )
+
+        return self._send_framebuffer(screen, screen_id, x, y, width, height, data)
+
+    def _send_framebuffer(
+        self,
+        screen: str,
+        screen_id: bytes,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        data: bytes,
+    ):
+        """Send packed pixels for a region of ``screen`` as a framebuffer command."""
+        # Header with screen ID, x, y, width, height; redraws of the same
+        # region reuse the packed bytes
+        region = (screen, x, y, width, height)
+        header = self._fb_headers.get(region)
+        if header is None:
+            if len(self._fb_headers) >= _MAX_CACHED_HEADERS:
+                self._fb_headers.clear()
+            header = _FB_HEADER.pack(screen_id, x, y, width, height)
+            self._fb_headers[region] = header
+
+        # Assemble the payload in the screen's reusable frame buffer
+        size = len(header) + len(data)
+        buffer = self._fb_buffers.get(screen)
+        if buffer is None or len(buffer) < size:
+            buffer = bytearray(size)
+            self._fb_buffers[screen] = buffer
+        buffer[: len(header)] = header
+        buffer[len(header) : size] = data
 
         # Send the frame buffer command with the image data
-        self.send(COMMANDS["FRAMEBUFF"], header + rgb565_data)
+        self.send(COMMANDS["FRAMEBUFF"], memoryview(buffer)[:size])
 
         return True
 
-    def update_firmware(self, firmware_path: str, chunk_size: int = 4096):
+    def update_firmware(
+        self, firmware_path: str, chunk_size: int = 4096, max_inflight: int = 4
+    ):
         """Update device firmware from a binary file.
 
         The firmware is sent in chunks using the ``FIRMWARE_UPDATE`` command.
+        On asynchronous connections up to ``max_inflight`` chunks are written
+        concurrently instead of waiting for each write in turn. Chunks are
+        still started at least ``command_interval`` apart.
 
         Args:
             firmware_path: Path to the firmware binary file.
             chunk_size: Size of each data chunk to send.
+            max_inflight: Maximum number of outstanding chunk writes on
+                asynchronous connections.
+
+        Returns:
+            asyncio.Task | None: When called from inside a running event loop
+            on an asynchronous connection, the task sending the firmware,
+            which the caller should await. Otherwise ``None`` once all data
+            has been sent.
         """
         self.logger.info("Updating firmware using %s", firmware_path)
 
-        with open(firmware_path, "rb") as fw:
-            offset = 0
-            chunk = fw.read(chunk_size)
-            while chunk:
-                header = struct.pack("<I", offset)
-                self.send(COMMANDS["FIRMWARE_UPDATE"], header + chunk)
-                offset += len(chunk)
+        if self.connection is not None and self._connection_is_async():
+            self.logger.debug("Pipelining firmware chunks (max_inflight=%d)", max_inflight)
+            update = self._update_firmware_async(firmware_path, chunk_size, max_inflight)
+            if _loop_running():
+                # The running loop cannot be re-entered; hand back a task
+                return asyncio.ensure_future(update)
+            asyncio.get_event_loop().run_until_complete(update)
+        else:
+            with open(firmware_path, "rb") as fw:
+                offset = 0
                 chunk = fw.read(chunk_size)
+                while chunk:
+                    header = struct.pack("<I", offset)
+                    self.send(COMMANDS["FIRMWARE_UPDATE"], header + chunk)
+                    offset += len(chunk)
+                    chunk = fw.read(chunk_size)
 
         self.logger.info("Firmware update data sent")
 
+    async def _update_firmware_async(
+        self, firmware_path: str, chunk_size: int, max_inflight: int = 4
+    ):
+        """Send firmware chunks with a bounded number of concurrent writes.
+
+        File reads run in the default executor so the event loop stays free to
+        service the connection. The semaphore is acquired before each read, so
+        at most ``max_inflight`` chunks are held in memory at any time. Each
+        write starts no sooner than ``command_interval`` after the previous
+        command, just as with :meth:`send`.
+
+        Packets already queued by :meth:`send` are flushed before the first
+        chunk. The first failed write, or a failed read, stops the update:
+        outstanding writes are cancelled and the error is raised.
+        """
+        if not self.connection or not self.connection.is_ready():
+            self.logger.warning("Cannot send firmware: connection not ready")
+            raise CommandError("Cannot send command: device connection is not ready")
+
+        # Let packets already queued by send() go out first so firmware
+        # chunks are never interleaved with them
+        if self._write_task is not None and not self._write_task.done():
+            await self._write_queue.join()
+
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(max_inflight)
+        writes = []
+        failures = []
+
+        async def write(packet: bytes):
+            try:
+                await self.connection.send(packet)
+            except Exception as e:
+                failures.append(e)
+                raise
+            finally:
+                semaphore.release()
+
+        try:
+            with open(firmware_path, "rb") as fw:
+                offset = 0
+                while True:
+                    await semaphore.acquire()
+                    if failures:
+                        # Stop streaming as soon as any chunk failed to send
+                        raise failures[0]
+                    chunk = await loop.run_in_executor(None, fw.read, chunk_size)
+                    if not chunk:
+                        semaphore.release()
+                        break
+                    packet = self._build_packet(
+                        COMMANDS["FIRMWARE_UPDATE"], struct.pack("<I", offset) + chunk
+                    )
+                    delay = self._command_delay()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    writes.append(asyncio.ensure_future(write(packet)))
+                    self._last_command_time = time.monotonic()
+                    offset += len(chunk)
+
+            await asyncio.gather(*writes)
+        except BaseException:
+            self.logger.error("Firmware update aborted; cancelling outstanding chunk writes")
+            for task in writes:
+                task.cancel()
+            await asyncio.gather(*writes, return_exceptions=True)
+            raise
+
     # Event handlers
     def on_button(self, data: bytes):
         """Handle button press/release events."""
@@ -434,7 +877,7 @@ class LoupedeckDevice(EventEmitter):
         if hw_button_id in self.button_mapping:
             button_id = self.button_mapping[hw_button_id]
         else:
-            button_id = BUTTONS.get(hw_button_id)
+            button_id = BUTTON_BY_CODE[hw_button_id]
         event = "down" if data[1] == 0x00 else "up"
         self.emit(event, {"id": button_id})
 
@@ -442,24 +885,26 @@ class LoupedeckDevice(EventEmitter):
         """Handle knob rotation events."""
         if len(data) < 2:
             return
-        knob = BUTTONS.get(data[0])
-        delta = struct.unpack("b", data[1:2])[0]
+        knob = BUTTON_BY_CODE[data[0]]
+        # Sign-extend the raw byte to a signed delta
+        delta = (data[1] ^ 0x80) - 0x80
         self.emit("rotate", {"id": knob, "delta": delta})
 
     def on_receive(self, data: bytes):
         """Dispatch incoming messages to the appropriate handler."""
-        if not data:
+        if len(data) < 3:
             return
-        msg_length = data[0]
-        cmd = data[1]
-        transaction = data[2]
+        msg_length, cmd, transaction = _HEADER.unpack_from(data)
         payload = data[3:msg_length]
         handler = self.handlers.get(cmd)
-        if handler:
+        if handler is not None:
             handler(payload)
-        resolver = self.pending_transactions.pop(transaction, None)
-        if resolver:
-            resolver(payload)
+        # Input events carry no pending transaction, so skip the pop for them
+        pending = self.pending_transactions
+        if pending:
+            resolver = pending.pop(transaction, None)
+            if resolver is not None:
+                resolver(payload)
 
 
 class LoupedeckLive(LoupedeckDevice):
@@ -570,23 +1015,54 @@ class RazerStreamControllerX(LoupedeckDevice):
         "center": {"id": b"\x00M", "width": 480, "height": 288},
     }
 
+    @classmethod
+    def _get_touch_points(cls) -> dict:
+        """Return the ``(x, y)`` centre of every key, keyed by key index.
+
+        Built on first use and stored on the class, like the display cache.
+        """
+        points = cls.__dict__.get("_touch_points")
+        if points is None:
+            points = {
+                key: (
+                    (key % cls.columns + 0.5) * cls.key_size,
+                    (key // cls.columns + 0.5) * cls.key_size,
+                )
+                for key in range(cls.columns * cls.rows)
+            }
+            cls._touch_points = points
+        return points
+
     def on_button(self, data: bytes):
-        """Emit additional touch events for the Razer controller."""
-        super().on_button(data)
-        event = "touchstart" if data[1] == 0x00 else "touchend"
-        key = BUTTONS.get(data[0])
-        row = key // self.columns
-        col = key % self.columns
+        """Emit button events plus matching touch events for the keys.
+
+        This does the base class's ``down``/``up`` handling itself so the
+        packet is decoded once for both events.
+        """
+        if len(data) < 2:
+            return
+        code = data[0]
+        pressed = data[1] == 0x00
+        key = BUTTON_BY_CODE[code]
+        if code in self.button_mapping:
+            button_id = self.button_mapping[code]
+        else:
+            button_id = key
+        self.emit("down" if pressed else "up", {"id": button_id})
+
+        point = self._get_touch_points().get(key)
+        if point is None:
+            return
         touch = {
             "id": 0,
-            "x": (col + 0.5) * self.key_size,
-            "y": (row + 0.5) * self.key_size,
+            "x": point[0],
+            "y": point[1],
             "target": {"key": key},
         }
         self.emit(
-            event,
+            "touchstart" if pressed else "touchend",
             {
-                "touches": [touch] if event == "touchstart" else [],
+                "touches": [touch] if pressed else [],
                 "changedTouches": [touch],
             },
         )
@@ -1,6 +1,17 @@
 from typing import Any, Dict, Type
 from . import device
 
+# Device classes keyed by USB product ID; the first class defining an ID wins
+_DEVICE_CLASSES: Dict[int, Type[device.LoupedeckDevice]] = {}
+for _cls in list(vars(device).values()):
+    if (
+        isinstance(_cls, type)
+        and issubclass(_cls, device.LoupedeckDevice)
+        and hasattr(_cls, "productId")
+    ):
+        _DEVICE_CLASSES.setdefault(_cls.productId, _cls)
+del _cls
+
 
 def discover(**kwargs: Any) -> device.LoupedeckDevice:
     """Discover and connect to a Loupedeck device.
@@ -23,11 +34,7 @@ def discover(**kwargs: Any) -> device.LoupedeckDevice:
         raise RuntimeError("No devices found")
     dev_info = devices[0]
     product_id = dev_info.get("productId")
-    device_class: Type[device.LoupedeckDevice] = None
-    for obj in device.__dict__.values():
-        if hasattr(obj, "productId") and getattr(obj, "productId") == product_id:
-            device_class = obj
-            break
+    device_class = _DEVICE_CLASSES.get(product_id)
     if not device_class:
         raise RuntimeError(f"Device with product ID {product_id} not yet supported")
     args: Dict[str, Any] = {
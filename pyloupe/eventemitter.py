@@ -1,9 +1,13 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 class EventEmitter:
+    __slots__ = ("_listeners",)
+
     def __init__(self) -> None:
-        self._listeners: Dict[str, List[Callable]] = {}
+        # Listener tuples are replaced rather than mutated, so emit() can
+        # iterate them directly even if a callback adds or removes listeners.
+        self._listeners: Dict[str, Tuple[Callable, ...]] = {}
 
     def on(self, event: str, callback: Callable) -> None:
         """Add a callback for an event.
@@ -12,7 +16,7 @@ class EventEmitter:
             event: The event name to listen for
             callback: The function to call when the event is emitted
         """
-        self._listeners.setdefault(event, []).append(callback)
+        self._listeners[event] = self._listeners.get(event, ()) + (callback,)
 
     def off(self, event: str, callback: Callable) -> None:
         """Remove a specific callback for an event.
@@ -21,11 +25,16 @@ class EventEmitter:
             event: The event name
             callback: The callback function to remove
         """
-        if event in self._listeners:
-            if callback in self._listeners[event]:
-                self._listeners[event].remove(callback)
-            if not self._listeners[event]:
-                del self._listeners[event]
+        listeners = self._listeners.get(event)
+        if listeners is None:
+            return
+        if callback in listeners:
+            index = listeners.index(callback)
+            listeners = listeners[:index] + listeners[index + 1:]
+        if listeners:
+            self._listeners[event] = listeners
+        else:
+            del self._listeners[event]
 
     def removeAllListeners(self, event: Optional[str] = None) -> None:
         """Remove all callbacks for a specific event, or all events if no event is specified.
@@ -47,5 +56,17 @@ class EventEmitter:
             *args: Positional arguments to pass to the callbacks
             **kwargs: Keyword arguments to pass to the callbacks
         """
-        for cb in list(self._listeners.get(event, [])):
-            cb(*args, **kwargs)
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+        if kwargs:
+            for cb in listeners:
+                cb(*args, **kwargs)
+        elif len(args) == 1:
+            # Every device and connection event passes a single payload
+            arg = args[0]
+            for cb in listeners:
+                cb(arg)
+        else:
+            for cb in listeners:
+                cb(*args)
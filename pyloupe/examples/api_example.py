@@ -113,8 +113,9 @@ def main():
     # Keep the script running to handle events
     print("Press Ctrl+C to exit...")
     try:
+        # Idle until Ctrl+C
         while True:
-            time.sleep(0.1)
+            time.sleep(3600)
     except KeyboardInterrupt:
         print("Exiting...")
     finally:
@@ -0,0 +1,31 @@
+"""Screen and key layout of a device, read once.
+
+Render callbacks that fire many times a second can take a
+``DeviceGeometry`` instead of walking ``device.displays`` on every frame.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class DeviceGeometry:
+    center_w: int
+    center_h: int
+    key_size: int
+    columns: int
+    rows: int
+    visible_x: Tuple[int, int]
+
+    @classmethod
+    def from_device(cls, device) -> "DeviceGeometry":
+        """Capture the layout from a device's class attributes."""
+        center = device.displays["center"]
+        return cls(
+            center_w=center["width"],
+            center_h=center["height"],
+            key_size=getattr(device, "key_size", 90),
+            columns=getattr(device, "columns", 0),
+            rows=getattr(device, "rows", 0),
+            visible_x=tuple(getattr(device, "visibleX", (0, center["width"]))),
+        )
@@ -9,6 +9,7 @@ This script tests the basic functionality of a Razer Stream Controller X device:
 5. Includes error handling and diagnostics
 """
 
+import functools
 import os
 import sys
 import time
@@ -18,27 +19,49 @@ from PIL import Image, ImageDraw, ImageFont
 # Allow running example directly from source checkout
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from device_geometry import DeviceGeometry
 from pyloupe.discovery import discover
 from pyloupe.device import RazerStreamControllerX
-from pyloupe.logger import set_log_level, LogLevel
+from pyloupe.logger import set_log_level
 
 # Set log level to INFO for better diagnostics
-set_log_level(LogLevel.INFO)
+set_log_level("INFO")
 
+BUTTON_COLORS = (
+    "#FF0000", "#FF7F00", "#FFFF00", "#00FF00", "#0000FF",
+    "#4B0082", "#9400D3", "#FF1493", "#00FFFF", "#FF00FF",
+    "#800000", "#808000", "#008000", "#800080", "#008080",
+)
+
+@functools.lru_cache(maxsize=None)
+def load_font(font_size):
+    """Load Arial at the given size, falling back to Pillow's default font."""
+    try:
+        return ImageFont.truetype("Arial", font_size)
+    except OSError:
+        # Fallback to default font if Arial is not available
+        return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=256)
+def measure_text(text, font):
+    """Return the (width, height) of text's bounding box, cached per font."""
+    left, top, right, bottom = font.getbbox(text)
+    return right - left, bottom - top
+
+@functools.lru_cache(maxsize=256)
 def create_button_image(label, color="#333333", width=96, height=96, font_size=18, text_color="#FFFFFF"):
-    """Create a button image with a label."""
+    """Create a button image with a label.
+
+    Images are cached by their arguments, so repeated redraws of the same
+    button reuse one rendering. The returned image is shared and must not
+    be modified.
+    """
     img = Image.new("RGB", (width, height), color)
     draw = ImageDraw.Draw(img)
-    
-    # Try to load a font
-    try:
-        font = ImageFont.truetype("Arial", font_size)
-    except:
-        # Fallback to default font if Arial is not available
-        font = ImageFont.load_default()
+    font = load_font(font_size)
     
     # Calculate text position to center it
-    text_width, text_height = draw.textsize(label, font=font)
+    text_width, text_height = measure_text(label, font)
     text_x = (width - text_width) // 2
     text_y = (height - text_height) // 2
     
@@ -50,33 +73,33 @@ def create_button_image(label, color="#333333", width=96, height=96, font_size=1
     
     return img
 
-def draw_button_grid(device):
+def draw_button_grid(device, geom):
     """Draw a grid of colored buttons with labels."""
-    colors = [
-        "#FF0000", "#FF7F00", "#FFFF00", "#00FF00", "#0000FF",
-        "#4B0082", "#9400D3", "#FF1493", "#00FFFF", "#FF00FF",
-        "#800000", "#808000", "#008000", "#800080", "#008080"
-    ]
-    
     print("Drawing button grid...")
-    for i in range(device.rows * device.columns):
-        col = i % device.columns
-        row = i // device.columns
-        color = colors[i % len(colors)]
+    # Compose every button into one frame so the grid goes out in a single transfer
+    key_size = geom.key_size
+    grid = Image.new("RGB", (geom.center_w, geom.center_h))
+    for i in range(geom.rows * geom.columns):
+        col = i % geom.columns
+        row = i // geom.columns
+        color = BUTTON_COLORS[i % len(BUTTON_COLORS)]
         label = f"Button {i+1}"
         
-        # Create and display button image
-        img = create_button_image(label, color, device.key_size, device.key_size)
-        x = col * device.key_size
-        y = row * device.key_size
-        device.display_image(img, "center", x, y)
-
-def draw_pressed_button(device, key, pressed=True):
-    """Draw a button in pressed or released state."""
-    col = key % device.columns
-    row = key // device.columns
-    x = col * device.key_size
-    y = row * device.key_size
+        img = create_button_image(label, color, key_size, key_size)
+        grid.paste(img, (col * key_size, row * key_size))
+    device.display_image(grid, "center")
+
+def draw_pressed_button(display, geom, key, pressed=True):
+    """Draw a button in pressed or released state.
+
+    ``display`` is the device's bound ``display_image`` method; it and the
+    grid geometry are passed in so the press handlers avoid attribute lookups.
+    """
+    key_size = geom.key_size
+    col = key % geom.columns
+    row = key // geom.columns
+    x = col * key_size
+    y = row * key_size
     
     # Create a different appearance for pressed buttons
     if pressed:
@@ -84,17 +107,12 @@ def draw_pressed_button(device, key, pressed=True):
         text_color = "#000000"
         label = f"Pressed {key+1}"
     else:
-        colors = [
-            "#FF0000", "#FF7F00", "#FFFF00", "#00FF00", "#0000FF",
-            "#4B0082", "#9400D3", "#FF1493", "#00FFFF", "#FF00FF",
-            "#800000", "#808000", "#008000", "#800080", "#008080"
-        ]
-        color = colors[key % len(colors)]
+        color = BUTTON_COLORS[key % len(BUTTON_COLORS)]
         text_color = "#FFFFFF"
         label = f"Button {key+1}"
     
-    img = create_button_image(label, color, device.key_size, device.key_size, text_color=text_color)
-    device.display_image(img, "center", x, y)
+    img = create_button_image(label, color, key_size, key_size, text_color=text_color)
+    display(img, "center", x, y)
 
 def draw_welcome_screen(device):
     """Draw a welcome screen with device information."""
@@ -104,18 +122,12 @@ def draw_welcome_screen(device):
     img = Image.new("RGB", (width, height), "#000080")
     draw = ImageDraw.Draw(img)
     
-    # Try to load a font
-    try:
-        title_font = ImageFont.truetype("Arial", 24)
-        body_font = ImageFont.truetype("Arial", 18)
-    except:
-        # Fallback to default font
-        title_font = ImageFont.load_default()
-        body_font = ImageFont.load_default()
+    title_font = load_font(24)
+    body_font = load_font(18)
     
     # Draw title
     title = "Razer Stream Controller X Test"
-    title_width, title_height = draw.textsize(title, font=title_font)
+    title_width, title_height = measure_text(title, title_font)
     draw.text(((width - title_width) // 2, 30), title, fill="#FFFFFF", font=title_font)
     
     # Draw device info
@@ -131,7 +143,7 @@ def draw_welcome_screen(device):
     
     y_pos = 80
     for line in info_text:
-        text_width, text_height = draw.textsize(line, font=body_font)
+        text_width, text_height = measure_text(line, body_font)
         draw.text(((width - text_width) // 2, y_pos), line, fill="#FFFFFF", font=body_font)
         y_pos += text_height + 10
     
@@ -166,34 +178,33 @@ def main():
     
     print(f"✅ Connected to {device.type}")
     
+    # Bind the values the press handlers use on every event
+    display = device.display_image
+    geom = DeviceGeometry.from_device(device)
+
     # Set up event handlers
-    @device.on("connect")
     def on_connect(info):
         print(f"Connected to {device.type} at {info.get('address')}")
         device.set_brightness(0.8)  # Set brightness to 80%
         draw_welcome_screen(device)
-        draw_button_grid(device)
+        draw_button_grid(device, geom)
     
-    @device.on("disconnect")
     def on_disconnect(err):
         if not err:
             return
         interval = getattr(device, "reconnect_interval", 3000)
         print(f"Connection lost ({getattr(err, 'message', err)}). Reconnecting in {interval/1000}s...")
     
-    @device.on("down")
     def on_button_down(data):
-        key = data.get("id")
+        key = data["id"]
         print(f"Button {key} pressed")
-        draw_pressed_button(device, key, True)
+        draw_pressed_button(display, geom, key, True)
     
-    @device.on("up")
     def on_button_up(data):
-        key = data.get("id")
+        key = data["id"]
         print(f"Button {key} released")
-        draw_pressed_button(device, key, False)
+        draw_pressed_button(display, geom, key, False)
     
-    @device.on("touchstart")
     def on_touch_start(data):
         touches = data.get("touches", [])
         for touch in touches:
@@ -201,7 +212,6 @@ def main():
             if key is not None:
                 print(f"Touch started on button {key}")
     
-    @device.on("touchend")
     def on_touch_end(data):
         changed_touches = data.get("changedTouches", [])
         for touch in changed_touches:
@@ -209,11 +219,19 @@ def main():
             if key is not None:
                 print(f"Touch ended on button {key}")
     
+    device.on("connect", on_connect)
+    device.on("disconnect", on_disconnect)
+    device.on("down", on_button_down)
+    device.on("up", on_button_up)
+    device.on("touchstart", on_touch_start)
+    device.on("touchend", on_touch_end)
+    
     # Run the test
     try:
         print("Test running. Press Ctrl+C to exit.")
+        # Idle until Ctrl+C
         while True:
-            time.sleep(0.1)
+            time.sleep(3600)
     except KeyboardInterrupt:
         print("Test ended by user.")
     finally:
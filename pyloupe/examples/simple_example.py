@@ -1,19 +1,30 @@
 """Simple device demonstration similar to the JavaScript example."""
 
+import functools
 import os
 import random
 import sys
 import threading
 import time
-from PIL import Image, ImageDraw
+from PIL import Image
 
 # Allow running example directly from source checkout
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from device_geometry import DeviceGeometry
+from pyloupe.color import parse_color
 from pyloupe.discovery import discover
 
 
-def draw_key_colors(dev) -> None:
+@functools.lru_cache(maxsize=None)
+def packed_run(color: str, count: int, byteorder: str) -> bytes:
+    """Return ``count`` RGB565 pixels of ``color`` in the screen's byte order."""
+    r, g, b, _ = parse_color(color)
+    pixel = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+    return pixel.to_bytes(2, "big" if byteorder == "be" else "little") * count
+
+
+def draw_key_colors(dev, geom: DeviceGeometry) -> None:
     """Fill each key area with a solid color."""
     colors = [
         "#f66",
@@ -29,59 +40,84 @@ def draw_key_colors(dev) -> None:
         "#c9c",
         "#d89",
     ]
-    if not hasattr(dev, "columns") or not hasattr(dev, "rows"):
+    if not geom.columns or not geom.rows:
         return
-    size = getattr(dev, "key_size", 90)
-    offset_x = getattr(dev, "visibleX", (0, 0))[0]
-    for i in range(dev.rows * dev.columns):
-        col = i % dev.columns
-        row = i // dev.columns
-        color = colors[i % len(colors)]
-        img = Image.new("RGB", (size, size), color)
-        dev.display_image(img, "center", offset_x + col * size, row * size)
-    if "left" in getattr(dev, "displays", {}):
-        w = dev.displays["left"]["width"]
-        h = dev.displays["left"]["height"]
-        dev.display_image(Image.new("RGB", (w, h), "white"), "left")
-    if "right" in getattr(dev, "displays", {}):
-        w = dev.displays["right"]["width"]
-        h = dev.displays["right"]["height"]
-        dev.display_image(Image.new("RGB", (w, h), "white"), "right")
+    size = geom.key_size
+    offset_x = geom.visible_x[0]
+    # Pack all keys into one RGB565 frame so they go out in a single transfer
+    # without a PIL conversion; the solid runs are packed once per color
+    width, height = geom.center_w, geom.center_h
+    order = dev.displays["center"].get("endianness", "le")
+    lines = []
+    for row in range(geom.rows):
+        line = [packed_run("#000", offset_x, order)]
+        for col in range(geom.columns):
+            color = colors[(row * geom.columns + col) % len(colors)]
+            line.append(packed_run(color, size, order))
+        line.append(packed_run("#000", width - offset_x - geom.columns * size, order))
+        lines.append(b"".join(line) * size)
+    lines.append(packed_run("#000", width * (height - geom.rows * size), order))
+    dev.display_buffer(b"".join(lines), "center")
+    for side in ("left", "right"):
+        if side in getattr(dev, "displays", {}):
+            info = dev.displays[side]
+            white = packed_run("#fff", info["width"] * info["height"], info.get("endianness", "le"))
+            dev.display_buffer(white, side)
     if "knob" in getattr(dev, "displays", {}):
         draw_grid(dev, 0)
 
 
+@functools.lru_cache(maxsize=None)
+def grid_image(w: int, h: int) -> Image.Image:
+    """Return the unrotated four-color grid for a screen size."""
+    half = w // 2
+    img = Image.new("RGB", (w, h), "black")
+    # Pasting a color fills the box directly, without a drawing context
+    img.paste((255, 102, 102), (0, 0, half, half))
+    img.paste((255, 221, 102), (half, 0, w, half))
+    img.paste((153, 238, 153), (0, half, half, h))
+    img.paste((136, 136, 204), (half, half, w, h))
+    return img
+
+
+@functools.lru_cache(maxsize=64)
+def rotated_grid_image(w: int, h: int, angle: int) -> Image.Image:
+    """Return the grid rotated by a whole number of degrees in [0, 360)."""
+    return grid_image(w, h).rotate(angle, expand=False)
+
+
 def draw_grid(dev, rotation: float) -> None:
     """Draw a simple rotated grid on the knob screen."""
     screen = dev.displays.get("knob")
     if not screen:
         return
-    w = screen["width"]
-    h = screen["height"]
-    half = w // 2
-    img = Image.new("RGB", (w, h), "black")
-    draw = ImageDraw.Draw(img)
-    draw.rectangle((0, 0, half - 1, half - 1), fill="#f66")
-    draw.rectangle((half, 0, w - 1, half - 1), fill="#fd6")
-    draw.rectangle((0, half, half - 1, h - 1), fill="#9e9")
-    draw.rectangle((half, half, w - 1, h - 1), fill="#88c")
-    img = img.rotate(rotation, expand=False)
+    # Knob steps are 9 degrees, so a full turn revisits 40 cached angles
+    img = rotated_grid_image(screen["width"], screen["height"], round(rotation) % 360)
     dev.display_image(img, "knob")
 
 
+def random_palette(size: int = 4096) -> list:
+    """Return ``size`` random RGB tuples drawn from one batch of random bits."""
+    raw = random.getrandbits(24 * size).to_bytes(3 * size, "little")
+    return [tuple(raw[i:i + 3]) for i in range(0, len(raw), 3)]
+
+
 def cycle_colors(dev) -> None:
     """Cycle button colors with random values."""
     idx = 0
     buttons = getattr(dev, "buttons", [])
+    palette = random_palette()
+    tick = 0
     while buttons:
-        r = random.randint(0, 255)
-        g = random.randint(0, 255)
-        b = random.randint(0, 255)
         try:
-            dev.set_button_color(buttons[idx], f"#{r:02x}{g:02x}{b:02x}")
+            dev.set_button_color(buttons[idx], palette[tick])
         except Exception:
             pass
         idx = (idx + 1) % len(buttons)
+        tick += 1
+        if tick == len(palette):
+            palette = random_palette()
+            tick = 0
         time.sleep(0.1)
 
 
@@ -94,13 +130,14 @@ def main() -> None:
             print(f"{exc}. Reattempting in 3 seconds...")
             time.sleep(3)
 
+    geom = DeviceGeometry.from_device(device)
     brightness = 1.0
     rotation = 180.0
 
     def on_connect(info):
         print(f"✅ Connected to {device.type} at {info.get('address')}")
         device.set_brightness(brightness)
-        draw_key_colors(device)
+        draw_key_colors(device, geom)
         if getattr(device, "buttons", []):
             thread = threading.Thread(target=cycle_colors, args=(device,), daemon=True)
             thread.start()
@@ -116,15 +153,15 @@ def main() -> None:
     def on_down(data):
         print(f"Button {data['id']} pressed")
         if data["id"] == 0:
-            draw_key_colors(device)
+            draw_key_colors(device, geom)
 
     def on_up(data):
         print(f"Button {data['id']} released")
 
     def on_rotate(data):
         nonlocal brightness, rotation
-        knob = data.get("id")
-        delta = data.get("delta", 0)
+        knob = data["id"]
+        delta = data["delta"]
         print(f"Knob {knob} rotated {'right' if delta > 0 else 'left'}")
         if knob == "knobCL":
             brightness = max(0.0, min(1.0, brightness + delta * 0.1))
@@ -141,8 +178,9 @@ def main() -> None:
     device.on("rotate", on_rotate)
 
     try:
+        # Idle until Ctrl+C
         while True:
-            time.sleep(0.1)
+            time.sleep(3600)
     except KeyboardInterrupt:
         pass
     finally:
@@ -1,5 +1,6 @@
 """Slide puzzle demo ported from the JavaScript example."""
 
+import functools
 import os
 import random
 import sys
@@ -8,16 +9,21 @@ import time
 from math import floor
 from pathlib import Path
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from device_geometry import DeviceGeometry
 from pyloupe.discovery import discover
 
 
 class Tile:
-    def __init__(self, source: Image.Image, sx: int, sy: int, row: int, column: int, correct_row: int, correct_col: int, bounds):
-        self.image = source.crop((sx, sy, sx + 90, sy + 90))
+    def __init__(self, pixels: np.ndarray, sx: int, sy: int, row: int, column: int, correct_row: int, correct_col: int, bounds):
+        # A view into the puzzle's source pixels; nothing is copied until drawn
+        self.pixels = pixels[sy:sy + 90, sx:sx + 90]
+        self._image = None
+        self.number = 0
         self.bounds = bounds
         self._row = row
         self._col = column
@@ -25,11 +31,20 @@ class Tile:
         self.correct_col = correct_col
         self.x = bounds[0][0] + column * 90
         self.y = bounds[1][0] + row * 90
+        # Pixels travelled from the current cell while being dragged
+        self.sub_x = 0
+        self.sub_y = 0
 
-    def can_move_in(self, direction, tiles) -> bool:
+    @property
+    def image(self) -> Image.Image:
+        if self._image is None:
+            self._image = Image.fromarray(np.ascontiguousarray(self.pixels))
+        return self._image
+
+    def can_move_in(self, direction, grid) -> bool:
         dx, dy = direction
-        search_x = (self.x + 90 - 1 + dx) if dx > 0 else (self.x + dx if dx < 0 else 0)
-        search_y = (self.y + 90 - 1 + dy) if dy > 0 else (self.y + dy if dy < 0 else 0)
+        search_x = (self.x + 90 - 1 + dx) if dx > 0 else self.x + dx
+        search_y = (self.y + 90 - 1 + dy) if dy > 0 else self.y + dy
         if (
             search_x < self.bounds[0][0]
             or search_x >= self.bounds[0][1]
@@ -37,7 +52,13 @@ class Tile:
             or search_y >= self.bounds[1][1]
         ):
             return False
-        return not any(t.contains((search_x, search_y)) for t in tiles)
+        # Look up the cell under the search point; it may still be this
+        # tile's own cell while it is partway through a move
+        occupant = grid[
+            (search_y - self.bounds[1][0]) // 90,
+            (search_x - self.bounds[0][0]) // 90,
+        ]
+        return occupant == 0 or occupant == self.number
 
     def contains(self, pos) -> bool:
         x, y = pos
@@ -46,6 +67,13 @@ class Tile:
     def in_place(self) -> bool:
         return self._row == self.correct_row and self._col == self.correct_col
 
+    def shift(self, columns: int, rows: int):
+        """Move to a neighbouring cell, keeping the current pixel position."""
+        self._col += columns
+        self._row += rows
+        self.sub_x -= columns * 90
+        self.sub_y -= rows * 90
+
     @property
     def row(self):
         return self._row
@@ -54,6 +82,7 @@ class Tile:
     def row(self, val):
         self._row = val
         self.y = self.bounds[1][0] + val * 90
+        self.sub_y = 0
 
     @property
     def column(self):
@@ -63,6 +92,7 @@ class Tile:
     def column(self, val):
         self._col = val
         self.x = self.bounds[0][0] + val * 90
+        self.sub_x = 0
 
 
 class SlidePuzzle:
@@ -75,11 +105,17 @@ class SlidePuzzle:
         self.columns = columns
         self.offset = offset
         self.tiles = []
+        self.grid = np.zeros((rows, columns), dtype=np.uint8)
         self.selected_tile = None
         self.source = None
+        self.pixels = None
 
     def init(self):
-        self.source = Image.open(self.image_path)
+        source = Image.open(self.image_path)
+        # Let JPEGs much larger than the board decode at a reduced DCT scale
+        source.draft("RGB", (self.offset[0] + self.columns * 90, self.rows * 90))
+        self.source = source.convert("RGB")
+        self.pixels = np.asarray(self.source)
         tiles = []
         for c in range(self.columns):
             for r in range(self.rows):
@@ -87,7 +123,7 @@ class SlidePuzzle:
                     continue
                 tiles.append(
                     Tile(
-                        self.source,
+                        self.pixels,
                         c * 90,
                         r * 90,
                         r,
@@ -101,6 +137,14 @@ class SlidePuzzle:
                     )
                 )
         self.tiles = tiles
+        self.build_grid()
+
+    def build_grid(self):
+        """Record which tile sits in each cell, numbering tiles from 1; 0 is empty."""
+        self.grid[:] = 0
+        for number, tile in enumerate(self.tiles, 1):
+            tile.number = number
+            self.grid[tile.row, tile.column] = number
 
     def shuffle(self):
         tmp = self.tiles[:]
@@ -115,6 +159,7 @@ class SlidePuzzle:
                 tile.row = r
                 shuffled.append(tile)
         self.tiles = shuffled
+        self.build_grid()
 
     def start(self):
         self.outcome = None
@@ -125,69 +170,95 @@ class SlidePuzzle:
         self.outcome = outcome
         self.on_win()
 
-    def move_tile(self, direction, pre_hook, post_hook):
+    def move_tile(self, direction, move_hook):
         if self.outcome:
             return
         if not self.selected_tile:
             for t in self.tiles:
-                if t.can_move_in(direction, self.tiles):
+                if t.can_move_in(direction, self.grid):
                     self.selected_tile = t
                     break
         if not self.selected_tile:
             return
-        if not self.selected_tile.can_move_in(direction, self.tiles):
+        if not self.selected_tile.can_move_in(direction, self.grid):
             return
-        pre_hook(self.selected_tile)
-        self.selected_tile.x += direction[0]
-        self.selected_tile.y += direction[1]
-        post_hook(self.selected_tile)
-        if (self.selected_tile.x - self.offset[0]) % 90 == 0 and self.selected_tile.y % 90 == 0:
-            self.selected_tile.column = self.selected_tile.x // 90
-            self.selected_tile.row = self.selected_tile.y // 90
+        tile = self.selected_tile
+        old_pos = (tile.x, tile.y)
+        tile.x += direction[0]
+        tile.y += direction[1]
+        tile.sub_x += direction[0]
+        tile.sub_y += direction[1]
+        move_hook(tile, old_pos, (tile.x, tile.y))
+        # Once the tile has travelled a whole cell it belongs to the next one
+        if tile.sub_x >= 90 or tile.sub_x <= -90 or tile.sub_y >= 90 or tile.sub_y <= -90:
+            step_x = (tile.sub_x >= 90) - (tile.sub_x <= -90)
+            step_y = (tile.sub_y >= 90) - (tile.sub_y <= -90)
+            self.grid[tile.row, tile.column] = 0
+            tile.shift(step_x, step_y)
+            self.grid[tile.row, tile.column] = tile.number
+        if tile.sub_x == 0 and tile.sub_y == 0:
             self.selected_tile = None
             if all(t.in_place() for t in self.tiles):
                 self.end("win")
 
 
-def pre_move(tile, dev):
-    img = Image.new("RGB", (90, 90), "black")
-    dev.display_image(img, "center", tile.x, tile.y)
-
+def apply_move(tile, old_pos, new_pos, dev):
+    # Redraw the union of the old and new tile rects in one write: the part
+    # the tile left stays black and the tile is pasted at its new offset.
+    left = min(old_pos[0], new_pos[0])
+    top = min(old_pos[1], new_pos[1])
+    width = max(old_pos[0], new_pos[0]) + 90 - left
+    height = max(old_pos[1], new_pos[1]) + 90 - top
+    img = Image.new("RGB", (width, height), "black")
+    img.paste(tile.image, (new_pos[0] - left, new_pos[1] - top))
+    dev.display_image(img, "center", left, top)
 
-def post_move(tile, dev):
-    dev.display_image(tile.image, "center", tile.x, tile.y)
 
-
-def win_render(dev, game):
-    x = random.randint(0, dev.displays["center"]["width"] - 32)
-    y = random.randint(0, dev.displays["center"]["height"] - 32)
-    crop = game.source.crop((x, y, x + 32, y + 32))
-    draw = ImageDraw.Draw(crop)
+@functools.lru_cache(maxsize=1)
+def heart_overlay() -> Image.Image:
+    """Return the win heart drawn centered on a transparent 32x32 image."""
+    img = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
     font = ImageFont.load_default()
-    w, h = draw.textsize("♥", font=font)
+    left, top, right, bottom = font.getbbox("♥")
+    w, h = right - left, bottom - top
     draw.text((16 - w // 2, 16 - h // 2), "♥", fill="red", font=font)
+    return img
+
+
+def win_render(dev, geom, game):
+    # Stay inside both the screen and the decoded source pixels
+    height, width = game.pixels.shape[:2]
+    x = random.randint(0, min(geom.center_w, width) - 32)
+    y = random.randint(0, min(geom.center_h, height) - 32)
+    crop = Image.fromarray(game.pixels[y:y + 32, x:x + 32].copy())
+    heart = heart_overlay()
+    crop.paste(heart, (0, 0), heart)
     dev.display_image(crop, "center", x, y)
 
 
 def main() -> None:
     device = discover()
+    geom = DeviceGeometry.from_device(device)
 
-    win_timer = None
+    # Set to stop the running win animation; each run gets a fresh event
+    win_stop = None
 
-    def schedule_win():
-        nonlocal win_timer
-        win_timer = threading.Timer(0.1, render_loop)
-        win_timer.start()
+    def render_loop(stop):
+        while not stop.is_set():
+            win_render(device, geom, game)
+            stop.wait(0.1)
 
-    def render_loop():
-        win_render(device, game)
-        schedule_win()
+    def start_win():
+        nonlocal win_stop
+        if win_stop is not None and not win_stop.is_set():
+            return
+        win_stop = threading.Event()
+        threading.Thread(target=render_loop, args=(win_stop,), daemon=True).start()
 
     def stop_win():
-        nonlocal win_timer
-        if win_timer:
-            win_timer.cancel()
-            win_timer = None
+        if win_stop is not None:
+            win_stop.set()
 
     def on_connect(info):
         print(f"✅ Connected to {device.type} at {info.get('address')}")
@@ -205,13 +276,12 @@ def main() -> None:
         try:
             direction = [0, 0]
             if str(data["id"]).endswith("T"):
-                direction[1] = -data.get("delta", 0) * MOVE_SPEED
+                direction[1] = -data["delta"] * MOVE_SPEED
             else:
-                direction[0] = data.get("delta", 0) * MOVE_SPEED
+                direction[0] = data["delta"] * MOVE_SPEED
             game.move_tile(
                 direction,
-                lambda t: pre_move(t, device),
-                lambda t: post_move(t, device),
+                lambda t, old, new: apply_move(t, old, new, device),
             )
         finally:
             lock.release()
@@ -221,25 +291,25 @@ def main() -> None:
     device.on("rotate", on_rotate)
 
     Path_this = Path(__file__).resolve().parent
-    image_file = "undredal.jpg" if device.displays["center"]["width"] > 360 else "yumi.jpg"
+    image_file = "undredal.jpg" if geom.center_w > 360 else "yumi.jpg"
     game = SlidePuzzle(
         Path_this.parent.parent / "examples" / "slide-puzzle" / image_file,
-        device.rows,
-        device.columns,
-        device.visibleX,
+        geom.rows,
+        geom.columns,
+        geom.visible_x,
     )
     game.init()
 
     def start_handler():
         stop_win()
-        img = Image.new("RGB", (device.displays["center"]["width"], device.displays["center"]["height"]))
-        draw = ImageDraw.Draw(img)
+        # Copy each tile's source slice straight into one canvas array
+        canvas = np.zeros((geom.center_h, geom.center_w, 3), dtype=np.uint8)
         for tile in game.tiles:
-            img.paste(tile.image, (tile.x, tile.y))
-        device.display_image(img, "center")
+            canvas[tile.y:tile.y + 90, tile.x:tile.x + 90] = tile.pixels
+        device.display_image(Image.fromarray(canvas), "center")
 
     def win_handler():
-        schedule_win()
+        start_win()
         if "left" in device.displays:
             device.display_image(Image.new("RGB", (device.displays["left"]["width"], device.displays["left"]["height"]), "white"), "left")
         if "right" in device.displays:
@@ -250,8 +320,9 @@ def main() -> None:
     game.start()
 
     try:
+        # Idle until Ctrl+C
         while True:
-            time.sleep(0.1)
+            time.sleep(3600)
     except KeyboardInterrupt:
         pass
     finally:
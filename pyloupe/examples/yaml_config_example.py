@@ -7,23 +7,29 @@ This script shows how to:
 3. Handle button presses to execute the configured actions
 """
 
+import functools
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
-import platform
-import subprocess
-import webbrowser
 from PIL import Image, ImageDraw, ImageFont
 
+# The libyaml-backed loader parses several times faster when PyYAML has it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Add the parent directory to the path so we can import pyloupe
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from pyloupe.api import connect
-from pyloupe.logger import set_log_level, LogLevel
+from pyloupe.logger import set_log_level
 
 # Set log level to INFO
-set_log_level(LogLevel.INFO)
+set_log_level("INFO")
 
 def execute_action(action):
     """Execute the action specified in the button configuration.
@@ -31,6 +37,11 @@ def execute_action(action):
     Args:
         action (str): The action to execute (application name or URL)
     """
+    # Only needed once a button fires, so keep them off the startup path
+    import platform
+    import subprocess
+    import webbrowser
+
     print(f"Executing action: {action}")
     
     if action.startswith("http://") or action.startswith("https://"):
@@ -49,9 +60,40 @@ def execute_action(action):
         except Exception as e:
             print(f"Error executing action '{action}': {e}")
 
+@functools.lru_cache(maxsize=32)
+def _load_font(name, size):
+    """Load a TrueType font once per name and size."""
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        # Fallback to default font if the font is not available
+        return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=256)
+def _measure_text(text, font):
+    """Return the (width, height) of text's bounding box, cached per font."""
+    left, top, right, bottom = font.getbbox(text)
+    return right - left, bottom - top
+
+@functools.lru_cache(maxsize=32)
+def _load_icon(icon_path, icon_size):
+    """Load and resize an icon once; returns None if it cannot be used."""
+    if not icon_path or not os.path.exists(icon_path):
+        return None
+    try:
+        icon = Image.open(icon_path)
+        return icon.resize((icon_size, icon_size))
+    except Exception as e:
+        print(f"Error loading icon '{icon_path}': {e}")
+        return None
+
+@functools.lru_cache(maxsize=128)
 def create_button_image(label, icon_path=None, width=90, height=90, 
                        background_color="#333333", text_color="#FFFFFF", font_size=14):
     """Create a button image with label and optional icon.
+
+    Results are cached by their arguments and shared between callers, so
+    the returned image must be copied before it is modified.
     
     Args:
         label (str): The text to display on the button
@@ -71,26 +113,13 @@ def create_button_image(label, icon_path=None, width=90, height=90,
     img = Image.new("RGBA", (width, height), bg_color)
     draw = ImageDraw.Draw(img)
     
-    # Try to load the icon if provided
-    icon = None
-    if icon_path and os.path.exists(icon_path):
-        try:
-            icon = Image.open(icon_path)
-            # Resize icon to fit on the button (leaving space for text)
-            icon_size = min(width, height) - 30
-            icon = icon.resize((icon_size, icon_size))
-        except Exception as e:
-            print(f"Error loading icon '{icon_path}': {e}")
+    # Load the icon if provided, sized to leave space for the text
+    icon = _load_icon(icon_path, min(width, height) - 30)
     
-    # Load a font
-    try:
-        font = ImageFont.truetype("Arial", font_size)
-    except:
-        # Fallback to default font if Arial is not available
-        font = ImageFont.load_default()
+    font = _load_font("Arial", font_size)
     
     # Calculate text position
-    text_width, text_height = draw.textsize(label, font=font)
+    text_width, text_height = _measure_text(label, font)
     
     if icon:
         # If we have an icon, position it above the text
@@ -153,8 +182,10 @@ def main():
     
     # Load the configuration
     try:
-        with open(config_path, "r") as file:
-            config = yaml.safe_load(file)
+        # Hand libyaml the whole file at once; it detects the encoding itself
+        with open(config_path, "rb") as file:
+            raw = file.read()
+        config = yaml.load(raw, Loader=YamlLoader)
     except Exception as e:
         print(f"Error loading configuration: {e}")
         return
@@ -171,65 +202,73 @@ def main():
     # Set brightness to 70%
     device.set_brightness(0.7)
     
-    # Apply button configurations
+    # Apply button configurations. Button images are rendered on a worker
+    # thread while this thread sends the finished ones; the device itself is
+    # only ever driven from here
     print("Applying button configurations...")
-    for button_id, button_config in config.get("buttons", {}).items():
-        try:
-            # Convert button_id to integer
-            hw_button_id = int(button_id)
-            
-            # Get button properties
-            label = button_config.get("label", "")
-            action = button_config.get("action", "")
-            icon_path = button_config.get("icon", "")
-            color = button_config.get("color", "#333333")
-            
-            # Set button mapping
-            device.set_button_mapping(hw_button_id, action)
-            
-            # Set button color if specified
-            if "color" in button_config:
-                device.set_button_color(str(hw_button_id), color)
-            
-            # Create and display button image
-            # Calculate button position (adjust based on your device layout)
-            # This assumes a 5-column layout
-            x = (hw_button_id - 1) % 5 * 90
-            y = (hw_button_id - 1) // 5 * 90
-            
-            # Create button image
-            button_image = create_button_image(
-                label, 
-                icon_path,
-                background_color=button_config.get("background", "#333333"),
-                text_color=button_config.get("font_color", "#FFFFFF"),
-                font_size=button_config.get("font_size", 14)
-            )
-            
-            # Display the button image
-            device.display_image(button_image, "center", x, y)
-            
-            print(f"Configured button {button_id}: {label} -> {action}")
-        except Exception as e:
-            print(f"Error configuring button {button_id}: {e}")
+    # Press handler lookup: hardware id -> action, resolved once up front
+    actions = {}
+    with ThreadPoolExecutor(max_workers=1) as render_pool:
+        renders = []
+        for button_id, button_config in config.get("buttons", {}).items():
+            try:
+                # Convert button_id to integer
+                hw_button_id = int(button_id)
+
+                # Start rendering the button image
+                image = render_pool.submit(
+                    create_button_image,
+                    button_config.get("label", ""),
+                    button_config.get("icon", ""),
+                    background_color=button_config.get("background", "#333333"),
+                    text_color=button_config.get("font_color", "#FFFFFF"),
+                    font_size=button_config.get("font_size", 14)
+                )
+                renders.append((button_id, hw_button_id, button_config, image))
+            except Exception as e:
+                print(f"Error configuring button {button_id}: {e}")
+
+        for button_id, hw_button_id, button_config, image in renders:
+            try:
+                # Get button properties
+                label = button_config.get("label", "")
+                action = button_config.get("action", "")
+                if action:
+                    actions[hw_button_id] = action
+
+                # Set button mapping
+                device.set_button_mapping(hw_button_id, action)
+
+                # Set button color if specified
+                if "color" in button_config:
+                    device.set_button_color(str(hw_button_id), button_config["color"])
+
+                # Calculate button position (adjust based on your device layout)
+                # This assumes a 5-column layout
+                x = (hw_button_id - 1) % 5 * 90
+                y = (hw_button_id - 1) // 5 * 90
+
+                # Display the button image; result() re-raises render errors
+                device.display_image(image.result(), "center", x, y)
+
+                print(f"Configured button {button_id}: {label} -> {action}")
+            except Exception as e:
+                print(f"Error configuring button {button_id}: {e}")
     
     # Set up event handlers
-    @device.on("down")
     def on_button_down(data):
-        button_id = data.get("id")
-        # Convert button ID to string for dictionary lookup
-        str_button_id = str(button_id)
-        
-        if str_button_id in config.get("buttons", {}):
-            action = config["buttons"][str_button_id].get("action", "")
-            if action:
-                execute_action(action)
+        action = actions.get(data["id"])
+        if action:
+            execute_action(action)
+
+    device.on("down", on_button_down)
     
     # Keep the script running to handle events
     print("Setup complete. Press Ctrl+C to exit...")
     try:
+        # Idle until Ctrl+C
         while True:
-            time.sleep(0.1)
+            time.sleep(3600)
     except KeyboardInterrupt:
         print("Exiting...")
     finally:
@@ -11,72 +11,230 @@ Usage:
     If config_file is not specified, the script will use the default button_config.yaml file.
 """
 
+import functools
+import json
 import os
 import sys
 import time
 import yaml
 import argparse
-from PIL import Image, ImageDraw, ImageFont
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# The libyaml-backed loader parses several times faster when PyYAML has it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# fastjsonschema turns the schema into a generated validator function
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 # Add the parent directory to the path so we can import pyloupe
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from pyloupe.api import connect
-from pyloupe.logger import set_log_level, LogLevel
+from pyloupe.logger import get_logger, set_log_level
 from pyloupe.exceptions import ValidationError
 
 # Set log level to INFO
-set_log_level(LogLevel.INFO)
+set_log_level("INFO")
+
+log = get_logger("yaml_config_test")
+
+def _load_cached_yaml(path):
+    """Load a YAML file, reusing the previous parse while the file is unchanged.
+
+    The parsed config is saved as JSON to ``<path>.cache`` together with the
+    source's modification time and size; the YAML file stays the source of
+    truth and any change to it forces a fresh parse. JSON turns integer
+    button keys into strings, which ``validate_config`` accepts either way.
+
+    Args:
+        path (str): Path to the YAML file
+
+    Returns:
+        The parsed configuration
+    """
+    st = os.stat(path)
+    key = [st.st_mtime_ns, st.st_size]
+    cache_path = path + ".cache"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as file:
+            cached = json.load(file)
+        if cached["key"] == key:
+            return cached["config"]
+    except Exception:
+        # A missing, stale or unreadable cache just means parsing the YAML
+        pass
+
+    # Hand libyaml the whole file at once; it detects the encoding itself
+    with open(path, "rb") as file:
+        raw = file.read()
+    config = yaml.load(raw, Loader=YamlLoader)
+
+    # Write to a temporary file first so a concurrent run never reads a
+    # half-written cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"key": key, "config": config}, file)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Values JSON cannot hold (dates, for instance) or an unwritable
+        # directory leave the config uncached
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return config
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "schemas", "button_config.schema.json")
+
+def _compile_schema():
+    """Compile the config schema once, or return None without fastjsonschema."""
+    if fastjsonschema is None:
+        return None
+    with open(SCHEMA_PATH, "r") as file:
+        return fastjsonschema.compile(json.load(file))
+
+_validate_schema = _compile_schema()
+
+# One button's settings with defaults filled in and its key position precomputed
+ButtonCfg = namedtuple(
+    "ButtonCfg",
+    "hw_id label action icon background font_color font_size color x y",
+)
 
 def validate_config(config):
-    """Validate the YAML configuration.
+    """Validate the YAML configuration and normalize its buttons.
     
     Args:
         config (dict): The loaded YAML configuration
         
     Returns:
-        tuple: (is_valid, errors) where is_valid is a boolean and errors is a list of error messages
+        tuple: (is_valid, errors, normalized) where is_valid is a boolean, errors is a
+        list of error messages and normalized is a list of ``ButtonCfg`` for the
+        buttons that could be read
     """
     errors = []
+    normalized = []
     
     # Check if the config has a 'buttons' section
     if 'buttons' not in config:
         errors.append("Configuration must have a 'buttons' section")
-        return False, errors
+        return False, errors, normalized
     
     # Check if the buttons section is a dictionary
     if not isinstance(config['buttons'], dict):
         errors.append("The 'buttons' section must be a dictionary")
-        return False, errors
+        return False, errors, normalized
+    
+    # With the compiled schema, a passing config skips the per-button
+    # structure checks below; a failing one still runs them so every problem
+    # is reported, not just the first one the schema hit
+    checked = False
+    icons = []
+    if _validate_schema is not None:
+        try:
+            # JSON Schema property names are strings; YAML gives int keys
+            _validate_schema({"buttons": {str(k): v for k, v in config['buttons'].items()}})
+            checked = True
+        except fastjsonschema.JsonSchemaException:
+            pass
     
     # Validate each button configuration
     for button_id, button_config in config['buttons'].items():
-        # Check if button_id is a valid integer
-        try:
-            int(button_id)
-        except ValueError:
-            errors.append(f"Button ID '{button_id}' must be a valid integer")
-            continue
-        
-        # Check if button_config is a dictionary
-        if not isinstance(button_config, dict):
-            errors.append(f"Configuration for button {button_id} must be a dictionary")
-            continue
-        
-        # Check for required fields
-        if 'label' not in button_config:
-            errors.append(f"Button {button_id} is missing required field 'label'")
-        
-        if 'action' not in button_config:
-            errors.append(f"Button {button_id} is missing required field 'action'")
+        if checked:
+            hw_id = int(button_id)
+        else:
+            # Check if button_id is a valid integer
+            try:
+                hw_id = int(button_id)
+            except ValueError:
+                errors.append(f"Button ID '{button_id}' must be a valid integer")
+                continue
+            
+            # Check if button_config is a dictionary
+            if not isinstance(button_config, dict):
+                errors.append(f"Configuration for button {button_id} must be a dictionary")
+                continue
+            
+            # Check for required fields
+            if 'label' not in button_config:
+                errors.append(f"Button {button_id} is missing required field 'label'")
+            
+            if 'action' not in button_config:
+                errors.append(f"Button {button_id} is missing required field 'action'")
         
-        # Validate icon path if provided
+        # Collect icon paths to check together below
         if 'icon' in button_config and button_config['icon']:
-            icon_path = button_config['icon']
-            if not os.path.exists(icon_path):
+            icons.append((button_id, button_config['icon']))
+        
+        # This assumes a 5-column layout
+        row, col = divmod(hw_id - 1, 5)
+        normalized.append(ButtonCfg(
+            hw_id=hw_id,
+            label=button_config.get("label", ""),
+            action=button_config.get("action", ""),
+            icon=button_config.get("icon", ""),
+            background=button_config.get("background", "#333333"),
+            font_color=button_config.get("font_color", "#FFFFFF"),
+            font_size=button_config.get("font_size", 14),
+            color=button_config.get("color"),
+            x=col * 90,
+            y=row * 90,
+        ))
+    
+    # Stat the icons concurrently so slow (e.g. network) filesystems
+    # overlap their latency instead of paying it once per button
+    if icons:
+        with ThreadPoolExecutor(max_workers=min(16, len(icons))) as executor:
+            found = list(executor.map(os.path.exists, [path for _, path in icons]))
+        for (button_id, icon_path), exists in zip(icons, found):
+            if not exists:
                 errors.append(f"Icon file for button {button_id} not found: {icon_path}")
     
-    return len(errors) == 0, errors
+    return len(errors) == 0, errors, normalized
+
+@functools.lru_cache(maxsize=32)
+def _load_font(name, size):
+    """Load a TrueType font once per name and size."""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        # Fallback to default font if the font is not available
+        return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=256)
+def _measure_text(text, font):
+    """Return the (width, height) of text's bounding box, cached per font."""
+    left, top, right, bottom = font.getbbox(text)
+    return right - left, bottom - top
+
+@functools.lru_cache(maxsize=256)
+def _load_icon(icon_path, icon_size, mtime):
+    """Load and resize an icon once per path, size and modification time.
+
+    The result is always RGBA so it can be pasted with itself as the mask.
+    """
+    from PIL import Image
+
+    icon = Image.open(icon_path)
+    return icon.resize((icon_size, icon_size)).convert("RGBA")
+
+@functools.lru_cache(maxsize=32)
+def _button_background(width, height, background_color):
+    """Return a shared solid button background; callers must copy it."""
+    from PIL import Image
+    from pyloupe.color import parse_color
+
+    return Image.new("RGBA", (width, height), parse_color(background_color))
 
 def create_button_image(label, icon_path=None, width=90, height=90, 
                        background_color="#333333", text_color="#FFFFFF", font_size=14):
@@ -94,32 +252,29 @@ def create_button_image(label, icon_path=None, width=90, height=90,
     Returns:
         PIL.Image.Image: The created button image
     """
-    # Create a new image with the specified background color
-    from pyloupe.color import parse_color
-    bg_color = parse_color(background_color)
-    img = Image.new("RGBA", (width, height), bg_color)
+    # PIL is only loaded once there is something to draw, so --help and
+    # config errors exit without it
+    from PIL import ImageDraw
+
+    # Start from a copy of the shared background for this size and color
+    img = _button_background(width, height, background_color).copy()
     draw = ImageDraw.Draw(img)
     
     # Try to load the icon if provided
     icon = None
     if icon_path and os.path.exists(icon_path):
         try:
-            icon = Image.open(icon_path)
             # Resize icon to fit on the button (leaving space for text)
             icon_size = min(width, height) - 30
-            icon = icon.resize((icon_size, icon_size))
+            icon = _load_icon(icon_path, icon_size, os.path.getmtime(icon_path))
         except Exception as e:
-            print(f"Error loading icon '{icon_path}': {e}")
+            log.error("Error loading icon '%s': %s", icon_path, e)
     
     # Load a font
-    try:
-        font = ImageFont.truetype("Arial", font_size)
-    except:
-        # Fallback to default font if Arial is not available
-        font = ImageFont.load_default()
+    font = _load_font("Arial", font_size)
     
     # Calculate text position
-    text_width, text_height = draw.textsize(label, font=font)
+    text_width, text_height = _measure_text(label, font)
     
     if icon:
         # If we have an icon, position it above the text
@@ -130,7 +285,7 @@ def create_button_image(label, icon_path=None, width=90, height=90,
         icon_x = (width - icon.size[0]) // 2
         
         # Paste the icon onto the button image
-        img.paste(icon, (icon_x, icon_y), icon if icon.mode == 'RGBA' else None)
+        img.paste(icon, (icon_x, icon_y), icon)
     else:
         # If no icon, center the text vertically
         text_y = (height - text_height) // 2
@@ -154,11 +309,11 @@ def test_button_press(device, button_id, action):
     Returns:
         bool: True if the test passed, False otherwise
     """
-    print(f"Testing button {button_id} with action: {action}")
+    log.debug("Testing button %s with action: %s", button_id, action)
     
     # We can't actually simulate a button press programmatically,
     # so we'll just log that we would test it
-    print(f"  Would press button {button_id} and verify action: {action}")
+    log.debug("Would press button %s and verify action: %s", button_id, action)
     
     return True
 
@@ -174,153 +329,152 @@ def main():
     
     # Check if the configuration file exists
     if not os.path.exists(config_path):
-        print(f"Error: Configuration file not found: {config_path}")
+        log.error("Configuration file not found: %s", config_path)
         return 1
     
     # Load the configuration
     try:
-        print(f"Loading configuration from {config_path}...")
-        with open(config_path, "r") as file:
-            config = yaml.safe_load(file)
+        log.info("Loading configuration from %s...", config_path)
+        config = _load_cached_yaml(config_path)
     except Exception as e:
-        print(f"Error loading configuration: {e}")
+        log.error("Error loading configuration: %s", e)
         return 1
     
     # Validate the configuration
-    print("Validating configuration...")
-    is_valid, errors = validate_config(config)
+    log.info("Validating configuration...")
+    is_valid, errors, buttons = validate_config(config)
     if not is_valid:
-        print("Configuration validation failed:")
+        log.error("Configuration validation failed:")
         for error in errors:
-            print(f"  - {error}")
+            log.error("  - %s", error)
         return 1
     
-    print("Configuration validation passed!")
+    log.info("Configuration validation passed!")
     
     # Connect to the device
     try:
-        print("Connecting to Loupedeck device...")
+        log.info("Connecting to Loupedeck device...")
         device = connect()
-        print(f"Connected to {device.type}!")
+        log.info("Connected to %s!", device.type)
     except Exception as e:
-        print(f"Error connecting to device: {e}")
+        log.error("Error connecting to device: %s", e)
         return 1
     
     # Set brightness to 70%
     device.set_brightness(0.7)
     
     # Apply button configurations
-    print("Applying button configurations...")
+    log.info("Applying button configurations...")
     button_count = 0
     success_count = 0
     
-    for button_id, button_config in config.get("buttons", {}).items():
+    # Devices without a key screen only get mappings and LED colors, so
+    # skip rendering entirely there
+    screen = getattr(device, "displays", {}).get("center")
+    frame = None
+    if screen is not None:
+        # Compose every button into one frame so the images go out in a
+        # single transfer instead of one per button
+        from PIL import Image
+        frame = Image.new("RGB", (screen["width"], screen["height"]))
+    
+    for button in buttons:
         try:
             button_count += 1
             
-            # Convert button_id to integer
-            hw_button_id = int(button_id)
-            
-            # Get button properties
-            label = button_config.get("label", "")
-            action = button_config.get("action", "")
-            icon_path = button_config.get("icon", "")
-            
-            print(f"Configuring button {button_id}: {label} -> {action}")
+            log.info("Configuring button %s: %s -> %s", button.hw_id, button.label, button.action)
             
             # Set button mapping
-            device.set_button_mapping(hw_button_id, action)
+            device.set_button_mapping(button.hw_id, button.action)
             
             # Set button color if specified
-            if "color" in button_config:
-                color = button_config.get("color")
+            if button.color is not None:
                 try:
-                    device.set_button_color(str(hw_button_id), color)
-                    print(f"  Set button color to {color}")
+                    device.set_button_color(str(button.hw_id), button.color)
+                    log.debug("  Set button color to %s", button.color)
                 except Exception as e:
-                    print(f"  Warning: Could not set button color: {e}")
-            
-            # Create and display button image
-            # Calculate button position (adjust based on your device layout)
-            # This assumes a 5-column layout
-            x = (hw_button_id - 1) % 5 * 90
-            y = (hw_button_id - 1) // 5 * 90
+                    log.warning("  Could not set button color: %s", e)
             
-            # Create button image
-            button_image = create_button_image(
-                label, 
-                icon_path,
-                background_color=button_config.get("background", "#333333"),
-                text_color=button_config.get("font_color", "#FFFFFF"),
-                font_size=button_config.get("font_size", 14)
-            )
-            
-            # Display the button image
-            device.display_image(button_image, "center", x, y)
+            if frame is not None:
+                # Create button image
+                button_image = create_button_image(
+                    button.label, 
+                    button.icon,
+                    background_color=button.background,
+                    text_color=button.font_color,
+                    font_size=button.font_size
+                )
+                
+                # Place the button image in the frame
+                frame.paste(button_image, (button.x, button.y))
             
             # Test the button
-            if test_button_press(device, hw_button_id, action):
+            if test_button_press(device, button.hw_id, button.action):
                 success_count += 1
-                print(f"  Button {button_id} configured successfully")
+                log.info("  Button %s configured successfully", button.hw_id)
             else:
-                print(f"  Button {button_id} configuration test failed")
+                log.warning("  Button %s configuration test failed", button.hw_id)
             
         except Exception as e:
-            print(f"Error configuring button {button_id}: {e}")
+            log.error("Error configuring button %s: %s", button.hw_id, e)
+    
+    if frame is not None:
+        try:
+            device.display_image(frame, "center")
+        except Exception as e:
+            log.error("Error displaying button images: %s", e)
     
-    print(f"\nConfiguration test results: {success_count}/{button_count} buttons configured successfully")
+    log.info("Configuration test results: %s/%s buttons configured successfully", success_count, button_count)
     
     # Set up event handlers for manual testing
-    print("\nSetup complete. You can now manually test the buttons.")
-    print("Press each button to verify that the correct action is executed.")
-    print("Press Ctrl+C to exit...")
+    log.info("Setup complete. You can now manually test the buttons.")
+    log.info("Press each button to verify that the correct action is executed.")
+    log.info("Press Ctrl+C to exit...")
     
     # Track which buttons have been pressed
+    buttons_by_id = {button.hw_id: button for button in buttons}
+    all_ids = frozenset(buttons_by_id)
+    total_buttons = len(all_ids)
     pressed_buttons = set()
     
-    @device.on("down")
     def on_button_down(data):
-        button_id = data.get("id")
-        # Convert button ID to string for dictionary lookup
-        str_button_id = str(button_id)
+        button_id = data["id"]
+        button = buttons_by_id.get(button_id)
         
-        if str_button_id in config.get("buttons", {}):
-            action = config["buttons"][str_button_id].get("action", "")
-            label = config["buttons"][str_button_id].get("label", "")
-            
-            print(f"Button {button_id} ({label}) pressed, action: {action}")
-            pressed_buttons.add(str_button_id)
+        if button is not None:
+            log.info("Button %s (%s) pressed, action: %s", button_id, button.label, button.action)
+            pressed_buttons.add(button_id)
             
             # Print progress
-            total_buttons = len(config.get("buttons", {}))
             pressed_count = len(pressed_buttons)
-            print(f"Progress: {pressed_count}/{total_buttons} buttons tested")
+            log.info("Progress: %s/%s buttons tested", pressed_count, total_buttons)
             
             if pressed_count == total_buttons:
-                print("All buttons have been tested!")
+                log.info("All buttons have been tested!")
+    
+    device.on("down", on_button_down)
     
     # Keep the script running to handle events
     try:
+        # Idle until Ctrl+C
         while True:
-            time.sleep(0.1)
+            time.sleep(3600)
     except KeyboardInterrupt:
-        print("Test ended by user.")
+        log.info("Test ended by user.")
     finally:
         # Print final results
-        total_buttons = len(config.get("buttons", {}))
         pressed_count = len(pressed_buttons)
-        print(f"\nFinal test results: {pressed_count}/{total_buttons} buttons tested")
+        log.info("Final test results: %s/%s buttons tested", pressed_count, total_buttons)
         
         # List untested buttons
-        if pressed_count < total_buttons:
-            print("Untested buttons:")
-            for button_id in config.get("buttons", {}):
-                if button_id not in pressed_buttons:
-                    label = config["buttons"][button_id].get("label", "")
-                    print(f"  - Button {button_id} ({label})")
+        untested = all_ids - pressed_buttons
+        if untested:
+            log.info("Untested buttons:")
+            for button_id in sorted(untested):
+                log.info("  - Button %s (%s)", button_id, buttons_by_id[button_id].label)
         
         device.close()
-        print("Test completed.")
+        log.info("Test completed.")
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
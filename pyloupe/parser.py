@@ -1,4 +1,9 @@
-from typing import List
+from typing import Iterator, List
+
+__all__ = ["MagicByteLengthParser"]
+
+# Consumed bytes kept at the front of the buffer before it is compacted
+_COMPACT_THRESHOLD = 4096
 
 
 class MagicByteLengthParser:
@@ -15,7 +20,10 @@ class MagicByteLengthParser:
             magic_byte: The byte value that marks the start of a packet
         """
         self.delimiter = magic_byte
-        self.buffer = b""
+        # Unconsumed data starts at _start; consumed bytes are only dropped
+        # from the front once enough have piled up to be worth the copy
+        self.buffer = bytearray()
+        self._start = 0
 
     def feed(self, chunk: bytes) -> List[bytes]:
         """Feed data into the parser and extract complete packets.
@@ -26,22 +34,73 @@ class MagicByteLengthParser:
         Returns:
             A list of complete packets extracted from the data
         """
-        data = self.buffer + chunk
-        packets = []
+        return list(self.feed_iter(chunk))
+
+    def feed_iter(self, chunk: bytes) -> Iterator[bytes]:
+        """Feed data into the parser and yield complete packets as they are found.
+
+        The chunk is buffered immediately; packets are parsed lazily while
+        the result is iterated. Stopping early leaves the remaining packets
+        in the buffer for the next call.
+
+        Args:
+            chunk: New data to be parsed
+
+        Returns:
+            An iterator over the complete packets extracted from the data
+        """
+        self.buffer += chunk
+        return self._packets()
+
+    def feed_views(self, chunk: bytes) -> Iterator[memoryview]:
+        """Like :meth:`feed_iter`, but yield zero-copy views into the buffer.
+
+        Each view is released as soon as iteration moves past it, so
+        consumers must copy (e.g. ``bytes(view)``) anything they keep and
+        must not hold slices of the view across the next step; a live
+        slice stops the buffer from growing and the next feed raises
+        ``BufferError``.
+
+        Args:
+            chunk: New data to be parsed
+
+        Returns:
+            An iterator over memoryviews of the complete packets
+        """
+        self.buffer += chunk
+        return self._packets(views=True)
+
+    def _packets(self, views: bool = False) -> Iterator:
+        data = self.buffer
+        size = len(data)
+        pos = self._start
+        # bytearray.find with an int needle is a memchr scan in C; binding
+        # it once keeps attribute lookups out of the per-packet loop
+        find = data.find
+        delimiter = self.delimiter
         while True:
-            position = data.find(bytes([self.delimiter]))
+            position = find(delimiter, pos)
             if position == -1:
                 break
-            if len(data) < position + 2:
+            if size < position + 2:
                 break
-            next_length = data[position + 1]
-            expected_end = position + next_length + 2
-            if len(data) < expected_end:
+            expected_end = position + data[position + 1] + 2
+            if size < expected_end:
                 break
-            packets.append(data[position + 2 : expected_end])
-            data = data[expected_end:]
-        self.buffer = data
-        return packets
+            if views:
+                view = memoryview(data)[position + 2 : expected_end]
+                pos = self._start = expected_end
+                try:
+                    yield view
+                finally:
+                    view.release()
+                continue
+            packet = bytes(data[position + 2 : expected_end])
+            pos = self._start = expected_end
+            yield packet
+        if pos > _COMPACT_THRESHOLD or pos == size:
+            del data[:pos]
+            self._start = 0
 
     def flush(self) -> List[bytes]:
         """Flush the buffer and return any remaining data as a packet.
@@ -49,6 +108,7 @@ class MagicByteLengthParser:
         Returns:
             A list containing the remaining data as a packet, or an empty list if no data remains
         """
-        data = self.buffer
-        self.buffer = b""
+        data = bytes(self.buffer[self._start :])
+        self.buffer = bytearray()
+        self._start = 0
         return [data] if data else []
@@ -19,6 +19,12 @@ setup(
         "Pillow>=9.0",
     ],
     extras_require={
+        "numpy": [
+            "numpy>=1.17",
+        ],
+        "yaml": [
+            "PyYAML>=5.1",
+        ],
         "dev": [
             "black==23.3.0",
             "flake8>=6.0.0",
@@ -28,6 +34,9 @@ setup(
             "build>=1.0.0",
             "twine>=4.0.0",
             "pytest-cov>=4.1.0",
+            "pytest-asyncio>=0.26",
+            "pytest-mock>=3.10",
+            "pytest-xdist>=3.0",
         ],
     },
     python_requires=">=3.7",
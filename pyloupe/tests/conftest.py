@@ -0,0 +1,45 @@
+"""Fixtures shared by the mock device test modules."""
+
+import pytest
+
+from pyloupe.device import LoupedeckDevice, LoupedeckLive
+from .mocks import MockWSConnection, reset_mock_device
+
+
+@pytest.fixture(scope="module")
+def mock_ws_device(module_mocker):
+    """Fixture that provides a LoupedeckDevice with a mock WebSocket connection.
+
+    Each test module gets one device shared by all of its tests;
+    ``_reset_mock_ws_device`` clears its state before each test that uses it.
+    """
+    module_mocker.patch('pyloupe.device.LoupedeckWSConnection', MockWSConnection)
+    module_mocker.patch('pyloupe.device.LoupedeckDevice.list', return_value=[
+        {"connectionType": MockWSConnection, "host": "mock-host"}
+    ])
+    device = LoupedeckDevice(auto_connect=True)
+    yield device
+    device.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_ws_device(request):
+    """Reset the shared mock WebSocket device, only for tests that use it."""
+    if "mock_ws_device" in request.fixturenames:
+        reset_mock_device(request.getfixturevalue("mock_ws_device"))
+
+
+@pytest.fixture
+def live_device(request, mocker):
+    """Fixture that provides a fresh device connected through a mock WebSocket.
+
+    The device is a LoupedeckLive unless another device class is passed by
+    indirect parametrization.
+    """
+    device_class = getattr(request, "param", LoupedeckLive)
+    mocker.patch('pyloupe.device.LoupedeckDevice.list', return_value=[
+        {"connectionType": MockWSConnection, "host": "mock-host"}
+    ])
+    device = device_class(auto_connect=True)
+    yield device
+    device.close()
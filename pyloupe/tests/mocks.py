@@ -76,6 +76,8 @@ class MockConnection(Connection):
         Args:
             data (bytes): The data to send.
         """
+        # Copy like a real transport; callers may reuse their buffer
+        data = bytes(data)
         self.sent_data.append(data)
         
         # Check if there's a response handler for this data
@@ -144,6 +146,8 @@ class MockWSConnection(MockConnection):
         Args:
             data (bytes): The data to send.
         """
+        # Copy like a real transport; callers may reuse their buffer
+        data = bytes(data)
         self.sent_data.append(data)
         
         # Check if there's a response handler for this data
@@ -190,6 +194,7 @@ class MockSerialConnection(MockConnection):
             data (bytes): The data to send.
             raw (bool): Whether to send the data raw or wrap it in a frame.
         """
+        data = bytes(data)
         self.sent_data.append((data, raw))
         
         # Check if there's a response handler for this data
@@ -197,4 +202,34 @@ class MockSerialConnection(MockConnection):
             if pattern in data:
                 response = handler(data)
                 if response:
-                    self.receive_data(response)
\ No newline at end of file
+                    self.receive_data(response)
+
+
+def reset_mock_device(device):
+    """Return a shared mock-connected device to its just-connected state.
+
+    Lets a module-scoped fixture reuse one device across tests without
+    sent data, listeners, mappings or cached frame buffers leaking from one
+    test into the next. Tests that change settings such as
+    ``command_interval`` should do so with ``monkeypatch``.
+
+    Args:
+        device: A LoupedeckDevice connected through a mock connection.
+    """
+    device.connection.sent_data.clear()
+    device.connection.received_data.clear()
+    device.removeAllListeners()
+    device.reset_button_mapping()
+    device.transaction_id = 0
+    device.pending_transactions.clear()
+    device._last_command_time = 0.0
+    if device._reconnect_task is not None:
+        device._reconnect_task.cancel()
+        device._reconnect_task = None
+    device._reconnect_attempt = 0
+    if device._write_task is not None:
+        device._write_task.cancel()
+        device._write_task = None
+        device._write_queue = None
+    device._fb_headers.clear()
+    device._fb_buffers.clear()
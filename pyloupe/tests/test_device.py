@@ -1,8 +1,17 @@
+import asyncio
+import os
 import struct
+import subprocess
+import sys
+import time
 from unittest.mock import MagicMock
 
+import pytest
+
+import pyloupe
 from pyloupe.device import LoupedeckDevice
-from pyloupe.constants import COMMANDS
+from pyloupe.constants import COMMANDS, RECONNECT_MAX_RETRIES
+from .mocks import MockSerialConnection, MockWSConnection
 
 
 def test_update_firmware(tmp_path):
@@ -23,3 +32,205 @@ def test_update_firmware(tmp_path):
     assert offset == 0
     assert first_call.args[1][4:] == b"abcd"
 
+
+def test_update_firmware_async_pipelined(tmp_path):
+    fw = tmp_path / "fw.bin"
+    fw.write_bytes(b"abcdefghij")
+
+    device = LoupedeckDevice(auto_connect=False)
+    device.connection = MockWSConnection()
+    asyncio.get_event_loop().run_until_complete(device.connection.connect())
+
+    device.update_firmware(str(fw), chunk_size=4, max_inflight=2)
+
+    sent = device.connection.sent_data
+    assert len(sent) == 3
+    assert all(packet[1] == COMMANDS["FIRMWARE_UPDATE"] for packet in sent)
+    offsets = [struct.unpack("<I", packet[3:7])[0] for packet in sent]
+    assert offsets == [0, 4, 8]
+    assert b"".join(packet[7:] for packet in sent) == b"abcdefghij"
+
+
+async def test_update_firmware_from_running_loop_keeps_command_interval(tmp_path):
+    fw = tmp_path / "fw.bin"
+    fw.write_bytes(b"abcdefghij")
+
+    device = LoupedeckDevice(auto_connect=False, command_interval=20)
+    device.connection = MockWSConnection()
+    await device.connection.connect()
+    send = device.connection.send
+    started = []
+
+    async def timed_send(packet):
+        started.append(time.monotonic())
+        await send(packet)
+
+    device.connection.send = timed_send
+
+    await device.update_firmware(str(fw), chunk_size=4, max_inflight=3)
+
+    assert len(device.connection.sent_data) == 3
+    gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+    assert all(gap >= 0.019 for gap in gaps)
+
+
+async def test_update_firmware_stops_on_failed_write(tmp_path):
+    fw = tmp_path / "fw.bin"
+    fw.write_bytes(b"abcdefghij")
+
+    device = LoupedeckDevice(auto_connect=False, command_interval=0)
+    device.connection = MockWSConnection()
+    await device.connection.connect()
+    send = device.connection.send
+    attempts = []
+
+    async def flaky_send(packet):
+        attempts.append(packet)
+        if len(attempts) == 2:
+            raise ConnectionError("link dropped")
+        await send(packet)
+
+    device.connection.send = flaky_send
+
+    with pytest.raises(ConnectionError):
+        await device.update_firmware(str(fw), chunk_size=4, max_inflight=1)
+
+    # The third chunk is never attempted once the second one fails
+    assert len(attempts) == 2
+    assert len(device.connection.sent_data) == 1
+
+
+async def test_update_firmware_read_error_settles_writes(mocker):
+    device = LoupedeckDevice(auto_connect=False, command_interval=0)
+    device.connection = MockWSConnection()
+    await device.connection.connect()
+    stalled = asyncio.Event()
+
+    async def stalled_send(packet):
+        await stalled.wait()
+
+    device.connection.send = stalled_send
+    fw = MagicMock()
+    fw.__enter__.return_value.read.side_effect = [b"abcd", OSError("read failed")]
+    mocker.patch("builtins.open", return_value=fw)
+    tasks_before = asyncio.all_tasks()
+
+    with pytest.raises(OSError):
+        await device.update_firmware("fw.bin", chunk_size=4, max_inflight=2)
+
+    # No chunk write is left running in the background
+    assert asyncio.all_tasks() <= tasks_before
+
+
+def test_update_firmware_waits_for_queued_sends(tmp_path):
+    fw = tmp_path / "fw.bin"
+    fw.write_bytes(b"abcdefgh")
+
+    device = LoupedeckDevice(auto_connect=False, command_interval=0)
+    device.connection = MockWSConnection()
+    send = device.connection.send
+
+    async def slow_send(packet):
+        if packet[1] == COMMANDS["SET_BRIGHTNESS"]:
+            await asyncio.sleep(0.01)
+        await send(packet)
+
+    device.connection.send = slow_send
+
+    async def scenario():
+        await device.connection.connect()
+        device.send(COMMANDS["SET_BRIGHTNESS"], b"\x05")
+        device.send(COMMANDS["SET_BRIGHTNESS"], b"\x06")
+        await device.update_firmware(str(fw), chunk_size=4, max_inflight=2)
+
+    asyncio.get_event_loop().run_until_complete(scenario())
+
+    commands = [packet[1] for packet in device.connection.sent_data]
+    assert commands == [COMMANDS["SET_BRIGHTNESS"]] * 2 + [COMMANDS["FIRMWARE_UPDATE"]] * 2
+    device.close()
+
+
+def test_send_from_running_loop_is_queued():
+    device = LoupedeckDevice(auto_connect=False, command_interval=0)
+    device.connection = MockWSConnection()
+
+    async def scenario():
+        await device.connection.connect()
+        first = device.send(COMMANDS["SET_BRIGHTNESS"], b"\x05")
+        second = device.send(COMMANDS["SET_BRIGHTNESS"], b"\x06")
+        # Nothing is written until the writer task gets to run
+        assert device.connection.sent_data == []
+        for _ in range(4):
+            await asyncio.sleep(0)
+        return first, second
+
+    first, second = asyncio.get_event_loop().run_until_complete(scenario())
+
+    sent = device.connection.sent_data
+    assert [packet[2] for packet in sent] == [first, second]
+    assert [packet[3:] for packet in sent] == [b"\x05", b"\x06"]
+    device.close()
+    assert device._write_task is None
+
+
+def test_close_flushes_queued_sends():
+    device = LoupedeckDevice(auto_connect=False, command_interval=10)
+    device.connection = MockWSConnection()
+
+    async def scenario():
+        await device.connection.connect()
+        start = time.monotonic()
+        for value in range(3):
+            device.send(COMMANDS["SET_BRIGHTNESS"], bytes([value]))
+        # The writer spaces the packets out; queueing never sleeps in the loop
+        return time.monotonic() - start
+
+    elapsed = asyncio.get_event_loop().run_until_complete(scenario())
+    connection = device.connection
+    device.close()
+
+    assert elapsed < 0.01
+    assert [packet[3:] for packet in connection.sent_data] == [b"\x00", b"\x01", b"\x02"]
+
+
+def test_reconnect_delay_backs_off_to_interval():
+    device = LoupedeckDevice(auto_connect=False, reconnect_interval=1000)
+
+    delays = [device._reconnect_delay(attempt) for attempt in range(5)]
+
+    for delay, base in zip(delays, [200, 400, 800, 1000, 1000]):
+        assert base * 0.9 <= delay <= base
+
+
+def test_reconnect_gives_up_after_max_retries():
+    device = LoupedeckDevice(auto_connect=False)
+    failures = []
+    device.on("reconnect_failed", failures.append)
+    device._reconnect_attempt = RECONNECT_MAX_RETRIES
+
+    device._schedule_reconnect()
+
+    assert failures == [{"attempts": RECONNECT_MAX_RETRIES}]
+    assert device._reconnect_task is None
+
+
+def test_manual_connect_resets_reconnect_attempts():
+    device = LoupedeckDevice(auto_connect=False)
+    device._reconnect_attempt = RECONNECT_MAX_RETRIES
+    device.list = MagicMock(return_value=[{"connectionType": MockSerialConnection, "path": "mock-path"}])
+
+    device.connect()
+
+    assert device._reconnect_attempt == 0
+
+
+def test_import_defers_transports_and_imaging():
+    code = (
+        "import sys, pyloupe, pyloupe.api; "
+        "print(sorted(m for m in ('PIL', 'numpy', 'serial', 'websockets') if m in sys.modules))"
+    )
+    root = os.path.dirname(os.path.dirname(pyloupe.__file__))
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,27 @@
+import pytest
+
+from pyloupe.device import LoupedeckCT, RazerStreamControllerX
+from pyloupe.discovery import discover
+from .mocks import MockWSConnection
+
+
+@pytest.mark.parametrize("product_id, device_class", [
+    (0x0003, LoupedeckCT),
+    (0x0D09, RazerStreamControllerX),
+])
+def test_discover_picks_class_by_product_id(mocker, product_id, device_class):
+    mocker.patch('pyloupe.device.LoupedeckDevice.list', return_value=[
+        {"connectionType": MockWSConnection, "host": "mock-host", "productId": product_id}
+    ])
+    device = discover(auto_connect=False)
+
+    assert type(device) is device_class
+    assert device.host == "mock-host"
+
+
+def test_discover_rejects_unknown_product_id(mocker):
+    mocker.patch('pyloupe.device.LoupedeckDevice.list', return_value=[
+        {"connectionType": MockWSConnection, "host": "mock-host", "productId": 0xFFFF}
+    ])
+    with pytest.raises(RuntimeError):
+        discover(auto_connect=False)
@@ -0,0 +1,66 @@
+from pyloupe.eventemitter import EventEmitter
+
+
+def test_emit_calls_listeners_in_order():
+    emitter = EventEmitter()
+    calls = []
+    emitter.on("event", lambda data: calls.append(("first", data)))
+    emitter.on("event", lambda data: calls.append(("second", data)))
+
+    emitter.emit("event", 1)
+
+    assert calls == [("first", 1), ("second", 1)]
+
+
+def test_emit_passes_all_arguments():
+    emitter = EventEmitter()
+    calls = []
+    emitter.on("event", lambda *args, **kwargs: calls.append((args, kwargs)))
+
+    emitter.emit("event")
+    emitter.emit("event", 1, 2)
+    emitter.emit("event", 1, key="value")
+
+    assert calls == [((), {}), ((1, 2), {}), ((1,), {"key": "value"})]
+
+
+def test_emit_without_listeners_is_a_no_op():
+    emitter = EventEmitter()
+
+    emitter.emit("unused", {"id": 1})
+
+    assert emitter._listeners == {}
+
+
+def test_off_during_emit_does_not_skip_listeners():
+    emitter = EventEmitter()
+    calls = []
+
+    def first(data):
+        calls.append("first")
+        emitter.off("event", first)
+
+    emitter.on("event", first)
+    emitter.on("event", lambda data: calls.append("second"))
+
+    emitter.emit("event", None)
+    emitter.emit("event", None)
+
+    assert calls == ["first", "second", "second"]
+
+
+def test_off_removes_last_listener():
+    emitter = EventEmitter()
+    callback = lambda data: None  # noqa: E731
+    emitter.on("event", callback)
+
+    emitter.off("event", callback)
+    emitter.off("missing", callback)
+
+    assert "event" not in emitter._listeners
+
+
+def test_emitter_uses_slots():
+    emitter = EventEmitter()
+
+    assert not hasattr(emitter, "__dict__")
@@ -8,6 +8,7 @@ between the device and the mock connections, simulating real-world usage scenari
 import pytest
 import asyncio
 import struct
+from collections import defaultdict
 from unittest.mock import patch, MagicMock
 
 from pyloupe.device import LoupedeckDevice
@@ -16,59 +17,57 @@ from pyloupe.constants import COMMANDS, BUTTONS
 from .mocks import MockWSConnection, MockSerialConnection
 
 
-@pytest.fixture
-def mock_ws_device():
-    """Fixture that provides a LoupedeckDevice with a mock WebSocket connection."""
-    with patch('pyloupe.device.LoupedeckWSConnection', MockWSConnection):
-        with patch('pyloupe.device.LoupedeckDevice.list', return_value=[
-            {"connectionType": MockWSConnection, "host": "mock-host"}
-        ]):
-            device = LoupedeckDevice(auto_connect=True)
-
-            # Add a response handler for the SET_BRIGHTNESS command
-            def brightness_response(data):
-                # Extract the command from the data
-                command = data[1]
-                transaction_id = data[2]
-
-                # If it's a SET_BRIGHTNESS command, send a success response
-                if command == COMMANDS["SET_BRIGHTNESS"]:
-                    # Create a response message with the same transaction ID
-                    response = bytes([3, COMMANDS["SET_BRIGHTNESS"], transaction_id])
-                    return response
-                return None
-
-            # Add the response handler to the mock connection
-            device.connection.add_response_handler(bytes([COMMANDS["SET_BRIGHTNESS"]]), brightness_response)
-
-            yield device
-            device.close()
+def brightness_response(data):
+    """Answer SET_BRIGHTNESS commands like the device does."""
+    # Extract the command from the data
+    command = data[1]
+    transaction_id = data[2]
 
+    # If it's a SET_BRIGHTNESS command, send a success response
+    if command == COMMANDS["SET_BRIGHTNESS"]:
+        # Create a response message with the same transaction ID
+        response = bytes([3, COMMANDS["SET_BRIGHTNESS"], transaction_id])
+        return response
+    return None
 
-@pytest.fixture
-def mock_api():
-    """Fixture that provides a LoupedeckAPI with a mock device."""
-    with patch('pyloupe.api.LoupedeckDevice') as mock_device_class:
-        # Create a mock device instance
-        mock_device = MagicMock()
-        mock_device_class.return_value = mock_device
 
-        # Set up the mock device to handle events
-        events = {}
-        def mock_on(event_type, handler):
-            events[event_type] = handler
-            return mock_device
-        mock_device.on.side_effect = mock_on
+@pytest.fixture(autouse=True)
+def _brightness_responses(request, _reset_mock_ws_device):
+    """Answer brightness commands on the shared device's current connection.
 
-        # Set up the mock device to emit events
-        def mock_emit(event_type, data):
-            if event_type in events:
-                events[event_type](data)
-        mock_device.emit = mock_emit
+    Added per test rather than in ``mock_ws_device`` because a reconnect
+    replaces the device's connection.
+    """
+    if "mock_ws_device" in request.fixturenames:
+        connection = request.getfixturevalue("mock_ws_device").connection
+        connection.add_response_handler(bytes([COMMANDS["SET_BRIGHTNESS"]]), brightness_response)
 
-        # Create the API with the mock device
-        api = LoupedeckAPI(mock_device)
-        yield api, mock_device
+
+@pytest.fixture
+def mock_api(mocker):
+    """Fixture that provides a LoupedeckAPI with a mock device."""
+    mock_device_class = mocker.patch('pyloupe.api.LoupedeckDevice')
+    # Create a mock device instance
+    mock_device = MagicMock()
+    mock_device_class.return_value = mock_device
+
+    # Set up the mock device to handle events; like the real device, every
+    # handler registered for an event is kept
+    events = defaultdict(list)
+    def mock_on(event_type, handler):
+        events[event_type].append(handler)
+        return mock_device
+    mock_device.on.side_effect = mock_on
+
+    # Set up the mock device to emit events
+    def mock_emit(event_type, data):
+        for handler in events.get(event_type, ()):
+            handler(data)
+    mock_device.emit = mock_emit
+
+    # Create the API with the mock device
+    api = LoupedeckAPI(mock_device)
+    yield api, mock_device
 
 
 def test_device_brightness_flow(mock_ws_device):
@@ -118,6 +117,21 @@ def test_api_button_handler(mock_api):
     assert button_pressed
 
 
+def test_api_shares_device_events(mock_api):
+    """Test that the API's handlers run alongside other device listeners."""
+    api, mock_device = mock_api
+
+    api_presses = []
+    api.set_button_handler("button1", lambda button_id, event_type: api_presses.append(event_type))
+    device_presses = []
+    mock_device.on("down", device_presses.append)
+
+    mock_device.emit("down", {"id": "button1"})
+
+    assert api_presses == ["down"]
+    assert device_presses == [{"id": "button1"}]
+
+
 def test_api_knob_handler(mock_api):
     """Test that knob handlers in the API work correctly."""
     api, mock_device = mock_api
@@ -142,29 +156,23 @@ def test_api_knob_handler(mock_api):
     assert rotation_delta == 5
 
 
-def test_device_reconnection(mock_ws_device):
-    """Test that the device can reconnect after a disconnection."""
-    # Set up a reconnection handler
-    reconnected = False
-    def on_reconnect(data):
-        nonlocal reconnected
-        reconnected = True
+async def test_device_reconnection(mock_ws_device, monkeypatch):
+    """Test that the device reconnects after the connection drops."""
+    # Keep the backoff delay to about a millisecond
+    monkeypatch.setattr(mock_ws_device, "reconnect_interval", 1)
 
-    mock_ws_device.on("reconnect", on_reconnect)
+    # Set up a reconnection handler
+    reconnected = asyncio.Event()
+    mock_ws_device.on("reconnect", lambda data: reconnected.set())
 
     # Simulate a disconnection
-    mock_ws_device.connection.emit("disconnect", None)
-
-    # Wait for the reconnection attempt
-    # In a real test, we would use asyncio.sleep or similar to wait for the reconnection
-    # For this mock test, we'll just simulate the reconnection directly
-    mock_ws_device._handle_disconnect(None)
-
-    # Simulate a successful reconnection
-    mock_ws_device.emit("reconnect", None)
+    old_connection = mock_ws_device.connection
+    await old_connection.close()
 
-    # Check that the reconnection handler was called
-    assert reconnected
+    # Wait for the scheduled reconnect task to connect again
+    await asyncio.wait_for(reconnected.wait(), timeout=1)
+    assert mock_ws_device.connection is not old_connection
+    assert mock_ws_device.connection.is_ready()
 
 
 def test_error_handling(mock_ws_device):
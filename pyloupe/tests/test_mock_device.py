@@ -7,35 +7,29 @@ to simulate device behavior without requiring physical devices.
 
 import pytest
 import struct
-from unittest.mock import patch
+from PIL import Image
 
-from pyloupe.device import LoupedeckDevice
-from pyloupe.constants import COMMANDS, BUTTONS
+from pyloupe.device import LoupedeckDevice, LoupedeckLive, RazerStreamControllerX
+from pyloupe.constants import COMMANDS, BUTTONS, BUTTONS_REVERSE
+from pyloupe.exceptions import ValidationError
 from .mocks import MockWSConnection, MockSerialConnection
 
-
-@pytest.fixture
-def mock_ws_device():
-    """Fixture that provides a LoupedeckDevice with a mock WebSocket connection."""
-    with patch('pyloupe.device.LoupedeckWSConnection', MockWSConnection):
-        with patch('pyloupe.device.LoupedeckDevice.list', return_value=[
-            {"connectionType": MockWSConnection, "host": "mock-host"}
-        ]):
-            device = LoupedeckDevice(auto_connect=True)
-            yield device
-            device.close()
+# Device messages shared by several tests: length, command, transaction ID, then payload
+_BUTTON_0_DOWN = bytes([5, COMMANDS["BUTTON_PRESS"], 1, 0, 0x00])
+_KNOB_8_CW = bytes([5, COMMANDS["KNOB_ROTATE"], 1, 8, 1])
+_KNOB_1_CCW = bytes([5, COMMANDS["KNOB_ROTATE"], 1, 1, 0xFF])
 
 
 @pytest.fixture
-def mock_serial_device():
+def mock_serial_device(mocker):
     """Fixture that provides a LoupedeckDevice with a mock Serial connection."""
-    with patch('pyloupe.device.LoupedeckSerialConnection', MockSerialConnection):
-        with patch('pyloupe.device.LoupedeckDevice.list', return_value=[
-            {"connectionType": MockSerialConnection, "path": "mock-path"}
-        ]):
-            device = LoupedeckDevice(auto_connect=True)
-            yield device
-            device.close()
+    mocker.patch('pyloupe.device.LoupedeckSerialConnection', MockSerialConnection)
+    mocker.patch('pyloupe.device.LoupedeckDevice.list', return_value=[
+        {"connectionType": MockSerialConnection, "path": "mock-path"}
+    ])
+    device = LoupedeckDevice(auto_connect=True)
+    yield device
+    device.close()
 
 
 def test_device_connection_ws(mock_ws_device):
@@ -69,6 +63,19 @@ def test_device_send_command(mock_ws_device):
     assert sent_data[3:] == data    # Command data
 
 
+def test_device_send_reuses_buffer(mock_serial_device):
+    """Test that consecutive sends share one packet buffer without corrupting earlier packets."""
+    mock_serial_device.command_interval = 0
+    mock_serial_device.send(COMMANDS["SET_COLOR"], b"\x07\x01\x02\x03")
+    buffer = mock_serial_device._send_buffer
+    mock_serial_device.send(COMMANDS["SET_BRIGHTNESS"], b"\x05")
+
+    assert mock_serial_device._send_buffer is buffer
+    first, second = (packet for packet, _ in mock_serial_device.connection.sent_data)
+    assert first == bytes([7, COMMANDS["SET_COLOR"], 1, 7, 1, 2, 3])
+    assert second == bytes([4, COMMANDS["SET_BRIGHTNESS"], 2, 5])
+
+
 def test_device_receive_button_event(mock_ws_device):
     """Test that a device can receive button events using a mock connection."""
     # Set up an event handler
@@ -78,21 +85,12 @@ def test_device_receive_button_event(mock_ws_device):
 
     mock_ws_device.on("down", on_button_down)
 
-    # Simulate receiving a button down event
-    button_id = 0  # First button
-    button_data = bytes([button_id, 0x00])  # 0x00 = down
-
-    # Create a message with the button press command
-    msg_length = 3 + len(button_data)
-    transaction_id = 1
-    message = bytes([msg_length, COMMANDS["BUTTON_PRESS"], transaction_id]) + button_data
-
-    # Simulate receiving the message
-    mock_ws_device.connection.receive_data(message)
+    # Simulate receiving a down event for the first button
+    mock_ws_device.connection.receive_data(_BUTTON_0_DOWN)
 
     # Check that the event was processed
     assert len(button_events) == 1
-    assert button_events[0]["id"] == BUTTONS.get(button_id)
+    assert button_events[0]["id"] == BUTTONS.get(0)
 
 
 def test_device_receive_knob_event(mock_ws_device):
@@ -104,23 +102,13 @@ def test_device_receive_knob_event(mock_ws_device):
 
     mock_ws_device.on("rotate", on_knob_rotate)
 
-    # Simulate receiving a knob rotation event
-    knob_id = 8  # First knob (depends on the device model)
-    delta = 1    # Clockwise rotation
-    knob_data = bytes([knob_id, delta])
-
-    # Create a message with the knob rotate command
-    msg_length = 3 + len(knob_data)
-    transaction_id = 1
-    message = bytes([msg_length, COMMANDS["KNOB_ROTATE"], transaction_id]) + knob_data
-
-    # Simulate receiving the message
-    mock_ws_device.connection.receive_data(message)
+    # Simulate a clockwise step of knob 8
+    mock_ws_device.connection.receive_data(_KNOB_8_CW)
 
     # Check that the event was processed
     assert len(knob_events) == 1
-    assert knob_events[0]["id"] == BUTTONS.get(knob_id)
-    assert knob_events[0]["delta"] == delta
+    assert knob_events[0]["id"] == BUTTONS.get(8)
+    assert knob_events[0]["delta"] == 1
 
 
 def test_device_button_mapping(mock_ws_device):
@@ -133,20 +121,11 @@ def test_device_button_mapping(mock_ws_device):
     mock_ws_device.on("down", on_button_down)
 
     # Set a custom button mapping
-    hw_button_id = 0
     custom_id = "custom_button"
-    mock_ws_device.set_button_mapping(hw_button_id, custom_id)
+    mock_ws_device.set_button_mapping(0, custom_id)
 
     # Simulate receiving a button down event for the mapped button
-    button_data = bytes([hw_button_id, 0x00])  # 0x00 = down
-
-    # Create a message with the button press command
-    msg_length = 3 + len(button_data)
-    transaction_id = 1
-    message = bytes([msg_length, COMMANDS["BUTTON_PRESS"], transaction_id]) + button_data
-
-    # Simulate receiving the message
-    mock_ws_device.connection.receive_data(message)
+    mock_ws_device.connection.receive_data(_BUTTON_0_DOWN)
 
     # Check that the event was processed with the custom ID
     assert len(button_events) == 1
@@ -170,6 +149,136 @@ def test_device_set_button_color(mock_ws_device):
     assert sent_data[1] == COMMANDS["SET_COLOR"]  # Command byte
 
     # Find the hardware button ID for the given button ID
-    hw_button_id = next((k for k, v in BUTTONS.items() if v == button_id), None)
+    hw_button_id = BUTTONS_REVERSE[button_id]
     assert sent_data[3] == hw_button_id  # Button ID
     assert sent_data[4:7] == bytes([255, 0, 0])  # RGB values for red
+
+
+def test_device_set_button_color_numbered_button(mock_ws_device, monkeypatch):
+    """Test that numbered buttons resolve to the first hardware code listed."""
+    mock_ws_device.set_button_color(0, "#0F0")
+
+    sent_data = mock_ws_device.connection.sent_data[0]
+    assert sent_data[3] == 0x07  # First code mapped to button 0
+    assert sent_data[4:7] == bytes([0, 255, 0])
+
+    # RGB tuples are accepted without formatting them as hex first
+    monkeypatch.setattr(mock_ws_device, "command_interval", 0)
+    mock_ws_device.set_button_color(0, (1, 2, 3))
+    assert mock_ws_device.connection.sent_data[1][3:7] == bytes([0x07, 1, 2, 3])
+
+    with pytest.raises(ValidationError):
+        mock_ws_device.set_button_color("missing", "#0F0")
+
+
+def test_device_display_image(live_device):
+    """Test that display_image sends a framebuffer header followed by RGB565 pixels."""
+    live_device.display_image(Image.new("RGB", (360, 270), "#FF0000"), "center")
+
+    sent_data = live_device.connection.sent_data[0]
+    assert sent_data[1] == COMMANDS["FRAMEBUFF"]  # Command byte
+    assert sent_data[3:5] == b"\x00M"  # Screen ID
+    assert struct.unpack("<HHHH", sent_data[5:13]) == (0, 0, 360, 270)
+    assert len(sent_data) == 13 + 360 * 270 * 2
+    assert sent_data[13:15] == struct.pack("<H", 0xF800)  # Red in RGB565
+
+    # Redrawing the same region reuses the cached header
+    live_device.command_interval = 0
+    live_device.display_image(Image.new("RGB", (360, 270), "#0000FF"), "center")
+    assert live_device.connection.sent_data[1][3:13] == sent_data[3:13]
+    assert list(live_device._fb_headers) == [("center", 0, 0, 360, 270)]
+
+
+def test_device_display_image_strict_size(live_device):
+    """Test that strict mode rejects images that would need resizing."""
+    with pytest.raises(ValidationError):
+        live_device.display_image(Image.new("RGB", (90, 90)), "center", strict=True)
+
+    assert live_device.connection.sent_data == []
+
+
+def test_device_display_buffer(live_device):
+    """Test that prepacked RGB565 data is sent as-is for the given region."""
+    pixels = struct.pack("<H", 0x07E0) * 90 * 90
+    live_device.display_buffer(pixels, "center", 90, 0, 90, 90)
+
+    sent_data = live_device.connection.sent_data[0]
+    assert sent_data[3:5] == b"\x00M"
+    assert struct.unpack("<HHHH", sent_data[5:13]) == (90, 0, 90, 90)
+    assert sent_data[13:] == pixels
+
+    with pytest.raises(ValidationError):
+        live_device.display_buffer(pixels, "center")
+    with pytest.raises(ValidationError):
+        live_device.display_buffer(pixels, "missing", 0, 0, 90, 90)
+
+
+@pytest.mark.parametrize("mode, color", [("L", 255), ("RGBA", (255, 255, 255, 255))])
+def test_device_display_image_downsizes(mode, color, live_device):
+    """Test that oversized images are scaled to the screen before sending."""
+    live_device.display_image(Image.new(mode, (720, 540), color), "center")
+
+    sent_data = live_device.connection.sent_data[0]
+    assert struct.unpack("<HHHH", sent_data[5:13]) == (0, 0, 360, 270)
+    assert sent_data[13:15] == b"\xff\xff"  # White in RGB565
+
+
+def test_device_receive_knob_event_negative_delta(mock_ws_device):
+    """Test that counter-clockwise knob rotation yields a negative delta."""
+    knob_events = []
+    mock_ws_device.on("rotate", knob_events.append)
+
+    mock_ws_device.connection.receive_data(_KNOB_1_CCW)
+
+    assert knob_events == [{"id": BUTTONS.get(1), "delta": -1}]
+
+
+def test_device_receive_resolves_pending_transaction(mock_ws_device):
+    """Test that a reply is passed to the resolver waiting on its transaction."""
+    replies = []
+    mock_ws_device.pending_transactions[7] = replies.append
+
+    mock_ws_device.connection.receive_data(bytes([4, COMMANDS["SET_BRIGHTNESS"], 7, 0x0A]))
+
+    assert replies == [b"\x0a"]
+    assert mock_ws_device.pending_transactions == {}
+
+
+def test_device_receive_truncated_header(mock_ws_device):
+    """Test that packets shorter than the 3-byte header are ignored."""
+    button_events = []
+    mock_ws_device.on("down", button_events.append)
+
+    mock_ws_device.connection.receive_data(bytes([3, COMMANDS["BUTTON_PRESS"]]))
+
+    assert button_events == []
+
+
+@pytest.mark.parametrize("live_device", [RazerStreamControllerX], indirect=True)
+def test_razer_x_button_emits_touch_events(live_device):
+    """Test that Razer Stream Controller X keys emit both button and touch events."""
+    events = []
+    live_device.on("down", lambda data: events.append(("down", data)))
+    live_device.on("touchstart", lambda data: events.append(("touchstart", data)))
+
+    # Key 6 sits in the second row, second column
+    live_device.connection.receive_data(bytes([5, COMMANDS["BUTTON_PRESS"], 0, 0x21, 0x00]))
+
+    touch = {"id": 0, "x": 144.0, "y": 144.0, "target": {"key": 6}}
+    assert events == [
+        ("down", {"id": 6}),
+        ("touchstart", {"touches": [touch], "changedTouches": [touch]}),
+    ]
+
+
+def test_device_display_image_honours_instance_displays(live_device):
+    """Test that a displays dict set on one device overrides its class layout."""
+    live_device.displays = {"center": {"id": b"\x00A", "width": 90, "height": 90}}
+    live_device.display_image(Image.new("RGB", (90, 90)), "center", strict=True)
+
+    sent_data = live_device.connection.sent_data[0]
+    assert sent_data[3:5] == b"\x00A"
+    assert struct.unpack("<HHHH", sent_data[5:13]) == (0, 0, 90, 90)
+
+    # Other devices of the same class keep the class layout
+    assert LoupedeckLive(auto_connect=False)._get_display_cache()["center"][0] == b"\x00M"
@@ -1,3 +1,5 @@
+import pytest
+
 from pyloupe.parser import MagicByteLengthParser
 
 
@@ -22,3 +24,34 @@ def test_flush_buffer():
     parser.feed(b"\x82\x02a")
     # flush returns any buffered data unchanged
     assert parser.flush() == [b"\x82\x02a"]
+
+
+def test_many_packets_across_compaction():
+    parser = MagicByteLengthParser(0x82)
+    stream = b"".join(b"\x82\x02" + bytes([i % 256, 0]) for i in range(3000))
+    packets = []
+    for i in range(0, len(stream), 7):
+        packets.extend(parser.feed(stream[i : i + 7]))
+    assert packets == [bytes([i % 256, 0]) for i in range(3000)]
+    assert parser.flush() == []
+
+
+def test_feed_iter_resumes_after_early_stop():
+    parser = MagicByteLengthParser(0x82)
+    packets = parser.feed_iter(b"\x82\x01a\x82\x01b\x82\x01c")
+    assert next(packets) == b"a"
+    # Packets not yet taken stay buffered for the next feed
+    assert parser.feed(b"\x82\x01d") == [b"b", b"c", b"d"]
+
+
+def test_feed_views_yields_released_views():
+    parser = MagicByteLengthParser(0x82)
+    seen = []
+    for view in parser.feed_views(b"\x82\x02ab\x82\x01"):
+        assert isinstance(view, memoryview)
+        seen.append((bytes(view), view))
+    assert [data for data, _ in seen] == [b"ab"]
+    # Views are released once iteration moves on, so the buffer can grow
+    with pytest.raises(ValueError):
+        seen[0][1].tobytes()
+    assert [bytes(v) for v in parser.feed_views(b"c")] == [b"c"]
@@ -1,5 +1,18 @@
+import random
 import struct
-from pyloupe.util import rgba2rgb565
+
+import pytest
+from PIL import Image
+from pyloupe import util
+from pyloupe.util import image2rgb565, rgba2rgb565
+
+
+def _reference_rgb565(rgba, pixel_size):
+    """Pack pixels one at a time, straight from the RGB565 definition."""
+    return b"".join(
+        struct.pack("<H", ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3))
+        for r, g, b, _ in zip(*[iter(rgba[: pixel_size * 4])] * 4)
+    )
 
 
 def test_rgba2rgb565_single_pixel_red():
@@ -16,3 +29,54 @@ def test_rgba2rgb565_two_pixels():
     result = rgba2rgb565(rgba, 2)
     expected = struct.pack('<HH', 0xF800, 0x07E0)
     assert result == expected
+
+
+def test_image2rgb565_matches_rgba2rgb565():
+    pixels = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (18, 52, 86)]
+    image = Image.new("RGB", (len(pixels), 1))
+    image.putdata(pixels)
+    rgba = bytes(c for p in pixels for c in p + (255,))
+    assert image2rgb565(image) == rgba2rgb565(rgba, len(pixels))
+
+
+def test_image2rgb565_big_endian():
+    image = Image.new("RGB", (1, 1), (255, 0, 0))
+    assert image2rgb565(image, big_endian=True) == struct.pack('>H', 0xF800)
+
+
+def test_rgba2rgb565_empty():
+    assert rgba2rgb565(b"", 0) == b""
+
+
+def test_rgba2rgb565_pillow_fallback(monkeypatch):
+    monkeypatch.setattr(util, "np", None)
+    rgba = bytes([
+        255, 0, 0, 255,
+        0, 255, 0, 255,
+    ])
+    assert rgba2rgb565(rgba, 2) == struct.pack('<HH', 0xF800, 0x07E0)
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "pillow"])
+@pytest.mark.parametrize("pixel_size", [1, 2, 17, 256])
+def test_rgba2rgb565_matches_reference(monkeypatch, numpy, pixel_size):
+    rng = random.Random(pixel_size)
+    rgba = bytes(rng.getrandbits(8) for _ in range(pixel_size * 4))
+    if not numpy:
+        monkeypatch.setattr(util, "np", None)
+    assert rgba2rgb565(rgba, pixel_size) == _reference_rgb565(rgba, pixel_size)
+
+
+def test_rgba2rgb565_accepts_buffers():
+    rgba = bytes([0, 0, 255, 255]) * 4
+    expected = struct.pack('<HHHH', *[0x001F] * 4)
+    assert rgba2rgb565(bytearray(rgba), 4) == expected
+    assert rgba2rgb565(memoryview(rgba), 4) == expected
+
+
+def test_image2rgb565_pillow_fallback(monkeypatch):
+    image = Image.new("RGB", (2, 1))
+    image.putdata([(255, 0, 0), (0, 255, 0)])
+    expected = image2rgb565(image, big_endian=True)
+    monkeypatch.setattr(util, "np", None)
+    assert image2rgb565(image, big_endian=True) == expected == struct.pack('>HH', 0xF800, 0x07E0)
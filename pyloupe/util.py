@@ -1,4 +1,55 @@
-import struct
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# NumPy is optional and slow to import, so it is loaded on the first
+# conversion rather than with the package. None means it is unavailable.
+_UNLOADED = object()
+np = _UNLOADED
+
+
+def _numpy():
+    """Return the numpy module, or ``None`` if it is not installed."""
+    global np
+    if np is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - optional dependency
+            numpy = None
+        np = numpy
+    return np
+
+# Lookup tables used by image2rgb565. The high byte of an RGB565 word holds
+# red plus the top three green bits, the low byte the remaining green bits
+# plus blue. The masked contributions never overlap, so adding two bands is
+# the same as OR-ing them.
+_RED_HIGH = [v & 0xF8 for v in range(256)]
+_GREEN_HIGH = [v >> 5 for v in range(256)]
+_GREEN_LOW = [(v & 0x1C) << 3 for v in range(256)]
+_BLUE_LOW = [v >> 3 for v in range(256)]
+
+
+def _pack_rgb565(red, green, blue, big_endian: bool = False) -> bytes:
+    """Pack ``uint8`` channel arrays into RGB565 bytes with NumPy.
+
+    The channels may be strided views. Only the ``uint16`` result and one
+    scratch array are allocated; every shift and mask updates them in place
+    so a full frame makes a single pass per channel.
+    """
+    packed = red.astype(np.uint16)
+    packed &= 0xF8
+    packed <<= 8
+    scratch = green.astype(np.uint16)
+    scratch &= 0xFC
+    scratch <<= 3
+    packed |= scratch
+    np.copyto(scratch, blue)
+    scratch >>= 3
+    packed |= scratch
+    return packed.astype(">u2" if big_endian else "<u2", copy=False).tobytes()
 
 
 def rgba2rgb565(rgba: bytes, pixel_size: int) -> bytes:
@@ -9,17 +60,61 @@ def rgba2rgb565(rgba: bytes, pixel_size: int) -> bytes:
     embedded displays to reduce memory usage.
 
     Args:
-        rgba: A bytes object containing RGBA data (4 bytes per pixel)
+        rgba: A bytes-like object containing RGBA data (4 bytes per pixel)
         pixel_size: The number of pixels in the data
 
     Returns:
         A bytes object containing the RGB565 data (2 bytes per pixel)
     """
-    output = bytearray(pixel_size * 2)
-    for i in range(0, pixel_size * 4, 4):
-        red = rgba[i]
-        green = rgba[i + 1]
-        blue = rgba[i + 2]
-        color = (blue >> 3) | ((green & 0xFC) << 3) | ((red & 0xF8) << 8)
-        struct.pack_into("<H", output, i // 2, color)
-    return bytes(output)
+    if pixel_size == 0:
+        return b""
+
+    np = _numpy()
+    if np is not None:
+        pixels = np.frombuffer(rgba, dtype=np.uint8, count=pixel_size * 4)
+        pixels = pixels.reshape(pixel_size, 4)
+        return _pack_rgb565(pixels[:, 0], pixels[:, 1], pixels[:, 2])
+
+    # Without NumPy, wrap the pixels as a one-row image and reuse the
+    # Pillow band operations instead of looping over pixels in Python
+    from PIL import Image
+
+    image = Image.frombytes("RGBA", (pixel_size, 1), bytes(rgba[: pixel_size * 4]))
+    return image2rgb565(image.convert("RGB"))
+
+
+def image2rgb565(image: Image.Image, big_endian: bool = False) -> bytes:
+    """Convert an RGB image to RGB565 byte data.
+
+    With NumPy installed the image is viewed as a ``(height, width, 3)``
+    array and packed with whole-array operations. Otherwise the conversion
+    runs inside Pillow: each channel is masked and shifted with a lookup
+    table, the partial bytes are combined per band and the two result bands
+    are interleaved by ``tobytes``. Neither path executes per-pixel Python
+    code.
+
+    Args:
+        image: A PIL image in ``RGB`` mode
+        big_endian: If ``True``, emit the high byte of each pixel first
+
+    Returns:
+        A bytes object containing the RGB565 data (2 bytes per pixel)
+    """
+    # NumPy is measurably faster than the Pillow path at every screen size
+    # (from 32x32 tiles up to full 480x270 frames), so it is always
+    # preferred when installed rather than gated on image area.
+    np = _numpy()
+    if np is not None:
+        pixels = np.asarray(image)
+        return _pack_rgb565(pixels[..., 0], pixels[..., 1], pixels[..., 2], big_endian)
+
+    from PIL import Image, ImageChops
+
+    # Pillow's "BGR;16" mode would do this in one convert() call, but it
+    # was deprecated in Pillow 10.4 and removed in 12, so it cannot be
+    # relied on with the Pillow>=9.0 requirement.
+    red, green, blue = image.split()
+    high = ImageChops.add(red.point(_RED_HIGH), green.point(_GREEN_HIGH))
+    low = ImageChops.add(green.point(_GREEN_LOW), blue.point(_BLUE_LOW))
+    bands = (high, low) if big_endian else (low, high)
+    return Image.merge("LA", bands).tobytes()